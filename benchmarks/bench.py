@@ -0,0 +1,273 @@
+"""End-to-end performance benchmark against the mock Vizio TV.
+
+Starts benchmarks/mock_tv.py in-process, points the integration's client,
+coordinator and entities at it, and reports:
+
+- requests per poll cycle
+- p50/p99 poll cycle time
+- commands per second for each entity command path
+
+Needs the integration's runtime dependencies (see
+benchmarks/requirements.txt). Run from the repository root:
+    python benchmarks/bench.py --cycles 50 --latency-ms 60 --jitter-ms 30
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.vizio_local.apps import AppCatalog  # noqa: E402
+from custom_components.vizio_local.client import VizioLocalClient  # noqa: E402
+from custom_components.vizio_local.const import (  # noqa: E402
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_REQUEST_TIMEOUT,
+)
+from custom_components.vizio_local.coordinator import VizioLocalCoordinator  # noqa: E402
+from custom_components.vizio_local.number import VizioNumberEntity  # noqa: E402
+from custom_components.vizio_local.remote import VizioRemote  # noqa: E402
+from custom_components.vizio_local.select import VizioSourceSelect  # noqa: E402
+from custom_components.vizio_local.sources import SourceListCache  # noqa: E402
+from custom_components.vizio_local.switch import (  # noqa: E402
+    VizioMuteSwitch,
+    VizioPowerSwitch,
+)
+from mock_tv import INPUTS, MockOptions, MockVizioTV, add_fault_arguments  # noqa: E402
+
+
+# Data keys of the entities enabled by default (their coordinator contexts)
+DEFAULT_ENTITY_KEYS = [
+    *(f"picture_{name}" for name in ("backlight", "brightness", "contrast", "color", "tint", "sharpness")),
+    "audio_volume",
+    "audio_mute",
+    "current_source",
+    "power_state",
+    "power_mode",
+]
+# Only volume, source and power enabled
+MINIMAL_ENTITY_KEYS = ["audio_volume", "current_source", "power_state", "power_mode"]
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the pct percentile of values (nearest rank)."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def create_hass(config_dir: str) -> HomeAssistant:
+    """Create a bare Home Assistant instance for the coordinator and entities."""
+    try:
+        hass = HomeAssistant(config_dir)
+    except TypeError:
+        # Older Home Assistant versions take no config_dir
+        hass = HomeAssistant()
+        hass.config.config_dir = config_dir
+    return hass
+
+
+def create_coordinator(
+    hass: HomeAssistant,
+    port: int,
+    token: str,
+    max_concurrent: int,
+    entity_keys: list[str],
+    capture_path: str | None = None,
+) -> VizioLocalCoordinator:
+    """Create a client and coordinator for the TV at 127.0.0.1:port.
+
+    A listener is subscribed per entity key, standing in for the enabled
+    entities that drive the coordinator's fetch plan.
+    """
+    client = VizioLocalClient(
+        "127.0.0.1",
+        port,
+        token,
+        pool_size=max_concurrent,
+        timeout=DEFAULT_REQUEST_TIMEOUT,
+        capture_path=capture_path,
+    )
+    coordinator = VizioLocalCoordinator(
+        hass,
+        client,
+        "Vizio",
+        "vizio",
+        max_concurrent,
+        asyncio.Semaphore(max_concurrent),
+    )
+    for key in entity_keys:
+        coordinator.async_add_listener(lambda: None, frozenset({key}))
+    return coordinator
+
+
+async def bench_polls(
+    coordinator: VizioLocalCoordinator, tv: MockVizioTV, cycles: int, full: bool
+) -> None:
+    """Run poll cycles and report requests and wall time per cycle.
+
+    Full cycles re-read and re-parse every settings group, as on the first
+    cycle. Steady-state cycles make the groups due as well, but keep their
+    last HASHLISTs, so unchanged groups are read without being parsed;
+    compare the two for what skipping the parse saves.
+    """
+    durations = []
+    requests = []
+    before_reads = dict(coordinator.group_reads)
+    for _ in range(cycles):
+        if full:
+            # Make every poll job due and every group re-parsed, as on the first cycle
+            coordinator._last_polled.clear()
+            coordinator._group_hashlists.clear()
+        else:
+            # Settings groups are due (their intervals are long), the rest as scheduled
+            for name in coordinator.fetch_plan:
+                if name not in ("current_source", "power_mode"):
+                    coordinator._last_polled.pop(name, None)
+        before = tv.request_count
+        start = time.perf_counter()
+        coordinator.data = await coordinator._async_update_data()
+        durations.append((time.perf_counter() - start) * 1000)
+        requests.append(tv.request_count - before)
+
+    reads = {kind: coordinator.group_reads[kind] - before_reads[kind] for kind in before_reads}
+    kind = "full" if full else "steady-state, groups unchanged"
+    print(f"\nPoll cycles ({kind}, {cycles} cycles)")
+    print(f"  requests/cycle  mean {statistics.mean(requests):6.2f}  max {max(requests)}")
+    print(f"  group reads     {reads['parsed']} parsed, {reads['unchanged']} unchanged")
+    print(f"  cycle time      p50 {percentile(durations, 50):7.1f} ms  p99 {percentile(durations, 99):7.1f} ms")
+
+
+async def bench_command(
+    name: str, command: Callable[[int], Awaitable[object]], tv: MockVizioTV, count: int
+) -> None:
+    """Run a command path count times back to back and report throughput."""
+    before = tv.request_count
+    start = time.perf_counter()
+    for i in range(count):
+        await command(i)
+    elapsed = time.perf_counter() - start
+    print(
+        f"  {name:<22} {count / elapsed:7.1f} cmd/s  "
+        f"{(tv.request_count - before) / count:5.2f} requests/cmd"
+    )
+
+
+async def bench_commands(
+    hass: HomeAssistant, coordinator: VizioLocalCoordinator, tv: MockVizioTV, count: int
+) -> None:
+    """Benchmark each entity command path, including its follow-up refresh."""
+    client = coordinator.client
+    backlight = VizioNumberEntity(coordinator, client, "backlight", "picture", 0, 100, 1)
+    mute = VizioMuteSwitch(coordinator, client)
+    power = VizioPowerSwitch(coordinator, client.vizio)
+    source = VizioSourceSelect(coordinator, client.vizio, SourceListCache(hass), AppCatalog(hass))
+    source._set_inputs(list(INPUTS))
+    remote = VizioRemote(coordinator, client)
+    for entity in (backlight, mute, power, source, remote):
+        entity.hass = hass
+
+    async def set_backlight(i: int) -> None:
+        await backlight._async_write_value(i % 100)
+        await coordinator.async_refresh_key("picture_backlight")
+
+    preset_settings = ("backlight", "brightness", "contrast", "color", "tint", "sharpness")
+
+    async def apply_preset(i: int) -> None:
+        await coordinator.async_apply_settings(
+            {"picture": {name: i % 50 for name in preset_settings}}
+        )
+
+    print(f"\nEntity commands ({count} each)")
+    await bench_command("number.set_value", set_backlight, tv, count)
+    await bench_command("picture preset (6)", apply_preset, tv, count)
+    await bench_command(
+        "remote macro (6 keys)",
+        lambda i: remote.async_send_keys(["MENU", {"key": "DOWN", "repeat": 3}, "OK", "EXIT"]),
+        tv,
+        count,
+    )
+    await bench_command("switch mute on/off", lambda i: mute._set_mute("On" if i % 2 else "Off"), tv, count)
+    await bench_command("select input", lambda i: source.async_select_option(INPUTS[1 + i % 5]), tv, count)
+    await bench_command(
+        "switch power on/off",
+        lambda i: power.async_turn_on() if i % 2 else power.async_turn_off(),
+        tv,
+        count,
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run the benchmark."""
+    tv = MockVizioTV(
+        MockOptions(
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            error_rate=args.error_rate,
+            stale_hash_rate=args.stale_hash_rate,
+            hang_rate=args.hang_rate,
+            settle_ms=args.settle_ms,
+        )
+    )
+    port = await tv.async_start()
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await create_hass(config_dir)
+        entity_keys = MINIMAL_ENTITY_KEYS if args.minimal_entities else DEFAULT_ENTITY_KEYS
+        coordinator = create_coordinator(
+            hass, port, tv.token, args.max_concurrent, entity_keys, args.capture
+        )
+        try:
+            await bench_polls(coordinator, tv, args.cycles, full=True)
+            await bench_polls(coordinator, tv, args.cycles, full=False)
+            await bench_commands(hass, coordinator, tv, args.commands)
+
+            stats = coordinator.client.connection_stats
+            print(
+                f"\nConnections: {stats['connections_created']} opened, "
+                f"{stats['connections_reused']} reused"
+            )
+            print("\nRequests by endpoint (client side):")
+            for endpoint, endpoint_stats in sorted(coordinator.client.endpoint_stats.items()):
+                print(
+                    f"  {endpoint_stats.count:6d}  p50 {endpoint_stats.percentile(50) or 0:7.1f} ms  "
+                    f"failed {endpoint_stats.failures:4d}  timed out {endpoint_stats.timeouts:4d}  {endpoint}"
+                )
+            print("\nRequests by endpoint (mock TV side):")
+            for endpoint, count in tv.requests.most_common():
+                print(f"  {count:6d}  {endpoint}")
+        finally:
+            await coordinator.client.async_close()
+            await tv.async_stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cycles", type=int, default=50, help="poll cycles per run")
+    parser.add_argument("--commands", type=int, default=50, help="commands per entity path")
+    parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENT_REQUESTS,
+        help="max_concurrent_requests for the coordinator",
+    )
+    parser.add_argument(
+        "--minimal-entities",
+        action="store_true",
+        help="only volume, source and power entities enabled (smaller fetch plan)",
+    )
+    parser.add_argument(
+        "--capture", metavar="PATH", help="record the traffic for benchmarks/replay.py"
+    )
+    add_fault_arguments(parser)
+    asyncio.run(main(parser.parse_args()))
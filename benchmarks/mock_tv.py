@@ -0,0 +1,401 @@
+"""Local stand-in for a Vizio SmartCast TV.
+
+Implements the endpoints listed in the README's HTTP API Reference over
+HTTPS with a throwaway self-signed certificate. Latency, errors and stale
+HASHVALs can be injected to see how the integration behaves against a slow
+or flaky TV.
+
+Run standalone:
+    python benchmarks/mock_tv.py --port 7345 --latency-ms 80
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import ssl
+import subprocess
+import tempfile
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from aiohttp import web
+
+SETTINGS_PREFIX = "/menu_native/dynamic/tv_settings"
+
+INPUTS = ["CAST", "HDMI-1", "HDMI-2", "HDMI-3", "HDMI-4", "HDMI-5", "COMP"]
+
+# App configs the mock reports as "current" (APP_ID, NAME_SPACE)
+APPS = {
+    "Netflix": ("1", 3),
+    "Prime Video": ("2", 3),
+    "Hulu": ("3", 3),
+    "YouTube": ("9", 3),
+    "Disney+": ("11", 3),
+}
+
+TYPE_SLIDER = "T_VALUE_ABS_V1"
+TYPE_LIST = "T_LIST_V1"
+TYPE_X_LIST = "T_LIST_X_V1"
+TYPE_MENU = "T_MENU_V1"
+
+
+@dataclass
+class MockOptions:
+    """Fault injection settings."""
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    # Fraction of requests answered with a failure status
+    error_rate: float = 0.0
+    # Fraction of PUTs whose (otherwise valid) HASHVAL is treated as stale
+    stale_hash_rate: float = 0.0
+    # Fraction of requests that never get an answer (client must time out)
+    hang_rate: float = 0.0
+    # Delay before a power, input or app change shows in the TV's state
+    settle_ms: float = 0.0
+
+
+def _default_settings() -> dict[str, dict[str, dict[str, Any]]]:
+    """Return initial settings, grouped by menu."""
+    slider = lambda value, minimum=0, maximum=100: {  # noqa: E731
+        "TYPE": TYPE_SLIDER, "VALUE": value, "MINIMUM": minimum, "MAXIMUM": maximum,
+    }
+    onoff = lambda value: {"TYPE": TYPE_LIST, "VALUE": value, "ELEMENTS": ["Off", "On"]}  # noqa: E731
+    return {
+        "picture": {
+            "backlight": slider(30),
+            "brightness": slider(50),
+            "contrast": slider(50),
+            "color": slider(50),
+            "tint": slider(0, -50, 50),
+            "sharpness": slider(10),
+            "auto_brightness_control": onoff("Off"),
+            "picture_mode": {
+                "TYPE": TYPE_X_LIST,
+                "VALUE": "Calibrated",
+                "ELEMENTS": ["Vivid", "Bright", "Calibrated", "Calibrated Dark", "Game"],
+            },
+        },
+        "audio": {
+            "volume": slider(15),
+            "mute": onoff("Off"),
+            "balance": slider(0, -50, 50),
+            "surround_sound": onoff("On"),
+            "volume_leveling": onoff("Off"),
+            "tv_speakers": {"TYPE": TYPE_LIST, "VALUE": "Auto", "ELEMENTS": ["Auto", "On", "Off"]},
+        },
+        "timers": {
+            "sleep_timer": {
+                "TYPE": TYPE_LIST,
+                "VALUE": "Off",
+                "ELEMENTS": ["Off", "30 minutes", "60 minutes", "90 minutes"],
+            },
+        },
+        "closed_captions": {
+            "closed_captions_enabled": onoff("Off"),
+        },
+        "system": {
+            "power_mode": {"TYPE": TYPE_LIST, "VALUE": "Quick Start", "ELEMENTS": ["Eco Mode", "Quick Start"]},
+        },
+    }
+
+
+class MockVizioTV:
+    """In-memory Vizio TV with an aiohttp HTTPS front end."""
+
+    def __init__(self, options: MockOptions | None = None, token: str = "mock-token") -> None:
+        """Initialize mock TV."""
+        self.options = options or MockOptions()
+        self.token = token
+        self.power = True
+        self.current_input = "HDMI-1"
+        self.current_app: str | None = None
+        self.settings = _default_settings()
+        self._hashes: dict[str, int] = {}
+        # Requests served, keyed by "METHOD path"
+        self.requests: Counter[str] = Counter()
+        self._runner: web.AppRunner | None = None
+        self._tmpdir: tempfile.TemporaryDirectory | None = None
+
+    # --- state helpers ---------------------------------------------------
+
+    def _hash(self, path: str) -> int:
+        """Return the current HASHVAL for path."""
+        if path not in self._hashes:
+            self._hashes[path] = random.getrandbits(31)
+        return self._hashes[path]
+
+    def _rotate(self, path: str) -> int:
+        """Give path a new HASHVAL (after it's modified)."""
+        self._hashes[path] = random.getrandbits(31)
+        return self._hashes[path]
+
+    def _item(self, group: str, name: str) -> dict[str, Any]:
+        """Return the JSON item for a setting."""
+        setting = self.settings[group][name]
+        item = {
+            "CNAME": name,
+            "NAME": name.replace("_", " ").title(),
+            "HASHVAL": self._hash(f"{group}/{name}"),
+            **setting,
+        }
+        return item
+
+    def group_hashlist(self, group: str) -> list[int]:
+        """Return HASHLIST for a group (the hashes of its items)."""
+        return [self._hash(f"{group}/{name}") for name in self.settings[group]]
+
+    def _settle(self, change: Callable[[], None]) -> None:
+        """Apply a power/input/app change once the TV has "settled"."""
+        if self.options.settle_ms:
+            asyncio.get_running_loop().call_later(self.options.settle_ms / 1000, change)
+        else:
+            change()
+
+    def _set_power(self, power: bool) -> None:
+        self.power = power
+
+    def _set_input(self, name: str) -> None:
+        self.current_input = name
+        self.current_app = None
+
+    def _set_app(self, name: str) -> None:
+        self.current_app = name
+
+    @property
+    def request_count(self) -> int:
+        """Return total requests served."""
+        return sum(self.requests.values())
+
+    # --- HTTP ------------------------------------------------------------
+
+    @staticmethod
+    def _ok(**body: Any) -> web.Response:
+        return web.json_response({"STATUS": {"RESULT": "SUCCESS", "DETAIL": "Success"}, **body})
+
+    @staticmethod
+    def _fail(result: str, detail: str) -> web.Response:
+        return web.json_response({"STATUS": {"RESULT": result, "DETAIL": detail}})
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        """Count requests and inject latency/faults."""
+        self.requests[f"{request.method} {request.path}"] += 1
+
+        if request.headers.get("AUTH") != self.token:
+            return self._fail("INVALID_AUTH", "Invalid auth token")
+
+        opts = self.options
+        if opts.hang_rate and random.random() < opts.hang_rate:
+            await asyncio.sleep(3600)
+        if opts.latency_ms or opts.jitter_ms:
+            delay = opts.latency_ms + random.uniform(-opts.jitter_ms, opts.jitter_ms)
+            await asyncio.sleep(max(delay, 0) / 1000)
+        if opts.error_rate and random.random() < opts.error_rate:
+            return self._fail("FAILURE", "Injected error")
+
+        return await handler(request)
+
+    async def _get_menus(self, request: web.Request) -> web.Response:
+        items = [
+            {"CNAME": group, "NAME": group.replace("_", " ").title(), "TYPE": TYPE_MENU}
+            for group in [*self.settings, "devices", "network"]
+        ]
+        return self._ok(ITEMS=items, URI=request.path)
+
+    async def _get_group(self, request: web.Request) -> web.Response:
+        group = request.match_info["group"]
+        if group not in self.settings:
+            return self._fail("URI_NOT_FOUND", "uri not found")
+        if not self.power and group != "system":
+            return self._ok(ITEMS=[])
+        items = [self._item(group, name) for name in self.settings[group]]
+        return self._ok(ITEMS=items, HASHLIST=self.group_hashlist(group), URI=request.path)
+
+    async def _get_setting(self, request: web.Request) -> web.Response:
+        group, name = request.match_info["group"], request.match_info["name"]
+        if name not in self.settings.get(group, {}):
+            return self._fail("URI_NOT_FOUND", "uri not found")
+        return self._ok(ITEMS=[self._item(group, name)], HASHLIST=self.group_hashlist(group), URI=request.path)
+
+    async def _put_setting(self, request: web.Request) -> web.Response:
+        group, name = request.match_info["group"], request.match_info["name"]
+        if name not in self.settings.get(group, {}):
+            return self._fail("URI_NOT_FOUND", "uri not found")
+
+        body = await request.json()
+        path = f"{group}/{name}"
+        if self.options.stale_hash_rate and random.random() < self.options.stale_hash_rate:
+            # Someone else changed it in the meantime
+            self._rotate(path)
+        if int(body.get("HASHVAL", -1)) != self._hash(path):
+            return self._fail("HASHVAL_ERROR", "hashval mismatch")
+
+        self.settings[group][name]["VALUE"] = body["VALUE"]
+        self._rotate(path)
+        return self._ok(ITEMS=[self._item(group, name)], URI=request.path)
+
+    async def _get_current_input(self, request: web.Request) -> web.Response:
+        item = {
+            "CNAME": "current_input",
+            "NAME": "Current Input",
+            "TYPE": TYPE_LIST,
+            "HASHVAL": self._hash("devices/current_input"),
+            "VALUE": "SMARTCAST" if self.current_app else self.current_input,
+        }
+        return self._ok(ITEMS=[item], URI=request.path)
+
+    async def _put_current_input(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        if int(body.get("HASHVAL", -1)) != self._hash("devices/current_input"):
+            return self._fail("HASHVAL_ERROR", "hashval mismatch")
+        self._settle(partial(self._set_input, body["VALUE"]))
+        self._rotate("devices/current_input")
+        return self._ok(URI=request.path)
+
+    async def _get_inputs(self, request: web.Request) -> web.Response:
+        items = [
+            {
+                "CNAME": name.lower().replace("-", ""),
+                "NAME": name,
+                "TYPE": "T_DEVICE_V1",
+                "HASHVAL": self._hash(f"devices/name_input/{name}"),
+                "VALUE": {"NAME": name, "METADATA": ""},
+            }
+            for name in INPUTS
+        ]
+        return self._ok(ITEMS=items, URI=request.path)
+
+    async def _get_power_mode(self, request: web.Request) -> web.Response:
+        return self._ok(ITEMS=[{"CNAME": "power_mode", "TYPE": "T_VALUE_V1", "VALUE": int(self.power)}])
+
+    async def _put_key_command(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        for key in body.get("KEYLIST", []):
+            codeset, code = key.get("CODESET"), key.get("CODE")
+            if codeset == 11:
+                power = {0: False, 1: True, 2: not self.power}.get(code, self.power)
+                self._settle(partial(self._set_power, power))
+            elif codeset == 5 and code in (0, 1):
+                volume = self.settings["audio"]["volume"]
+                volume["VALUE"] = max(0, min(100, volume["VALUE"] + (1 if code else -1)))
+                self._rotate("audio/volume")
+            elif codeset == 5 and code in (2, 3, 4):
+                mute = self.settings["audio"]["mute"]
+                mute["VALUE"] = {2: "Off", 3: "On", 4: "On" if mute["VALUE"] == "Off" else "Off"}[code]
+                self._rotate("audio/mute")
+        return self._ok(URI=request.path)
+
+    async def _get_current_app(self, request: web.Request) -> web.Response:
+        value = None
+        if self.current_app:
+            app_id, name_space = APPS[self.current_app]
+            value = {"APP_ID": app_id, "NAME_SPACE": name_space, "MESSAGE": None}
+        return self._ok(ITEM={"TYPE": "T_APP_V1", "VALUE": value})
+
+    async def _put_launch_app(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        config = body.get("VALUE") or {}
+        for name, (app_id, name_space) in APPS.items():
+            if config.get("APP_ID") == app_id and config.get("NAME_SPACE") == name_space:
+                self._settle(partial(self._set_app, name))
+                return self._ok(URI=request.path)
+        return self._fail("INVALID_PARAMETER", "unknown app")
+
+    def build_app(self) -> web.Application:
+        """Return the aiohttp application for this TV."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get(f"{SETTINGS_PREFIX}/devices/current_input", self._get_current_input)
+        app.router.add_put(f"{SETTINGS_PREFIX}/devices/current_input", self._put_current_input)
+        app.router.add_get(f"{SETTINGS_PREFIX}/devices/name_input", self._get_inputs)
+        app.router.add_get(SETTINGS_PREFIX, self._get_menus)
+        app.router.add_get(f"{SETTINGS_PREFIX}/{{group}}", self._get_group)
+        app.router.add_get(f"{SETTINGS_PREFIX}/{{group}}/{{name}}", self._get_setting)
+        app.router.add_put(f"{SETTINGS_PREFIX}/{{group}}/{{name}}", self._put_setting)
+        app.router.add_get("/state/device/power_mode", self._get_power_mode)
+        app.router.add_put("/key_command/", self._put_key_command)
+        app.router.add_get("/app/current", self._get_current_app)
+        app.router.add_put("/app/launch", self._put_launch_app)
+        return app
+
+    def _ssl_context(self) -> ssl.SSLContext:
+        """Create a throwaway self-signed certificate (like the TV's)."""
+        self._tmpdir = tempfile.TemporaryDirectory()
+        cert = Path(self._tmpdir.name) / "cert.pem"
+        key = Path(self._tmpdir.name) / "key.pem"
+        subprocess.run(
+            [
+                "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+                "-keyout", str(key), "-out", str(cert),
+                "-days", "1", "-subj", "/CN=localhost",
+            ],
+            check=True,
+            capture_output=True,
+        )
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert, key)
+        return context
+
+    async def async_start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """Start serving and return the port."""
+        self._runner = web.AppRunner(self.build_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port, ssl_context=self._ssl_context())
+        await site.start()
+        return self._runner.addresses[0][1]
+
+    async def async_stop(self) -> None:
+        """Stop serving."""
+        if self._runner:
+            await self._runner.cleanup()
+        if self._tmpdir:
+            self._tmpdir.cleanup()
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    tv = MockVizioTV(
+        MockOptions(
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            error_rate=args.error_rate,
+            stale_hash_rate=args.stale_hash_rate,
+            hang_rate=args.hang_rate,
+            settle_ms=args.settle_ms,
+        ),
+        token=args.token,
+    )
+    port = await tv.async_start(args.host, args.port)
+    print(f"Mock Vizio TV on https://{args.host}:{port} (AUTH: {args.token})")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await tv.async_stop()
+
+
+def add_fault_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the fault injection options to an argument parser."""
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="added latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="+/- random latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests that fail")
+    parser.add_argument("--stale-hash-rate", type=float, default=0.0, help="fraction of PUTs with a stale HASHVAL")
+    parser.add_argument("--hang-rate", type=float, default=0.0, help="fraction of requests never answered")
+    parser.add_argument(
+        "--settle-ms", type=float, default=0.0, help="delay before power/input/app changes take effect"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7345)
+    parser.add_argument("--token", default="mock-token")
+    add_fault_arguments(parser)
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
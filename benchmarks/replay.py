@@ -0,0 +1,144 @@
+"""Replay captured TV traffic through the coordinator and entity commands.
+
+Serves a capture recorded with the integration's `capture` option from a
+local HTTPS stand-in: each request gets the TV's captured response for the
+same method and path, in the order they were captured (wrapping around).
+Requests that timed out or failed in the capture hang, so the client times
+out again. Then runs poll cycles and the entity command paths against it
+like bench.py, optionally under cProfile, so parsing and scheduling
+overhead can be profiled and compared between versions on real traffic.
+
+Run from the repository root:
+    python benchmarks/replay.py vizio_local_capture_vizio.jsonl.gz --realtime --profile
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import cProfile
+import gzip
+import json
+import pstats
+import sys
+import tempfile
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from aiohttp import web  # noqa: E402
+
+from bench import (  # noqa: E402
+    DEFAULT_ENTITY_KEYS,
+    bench_commands,
+    bench_polls,
+    create_coordinator,
+    create_hass,
+)
+from custom_components.vizio_local.const import DEFAULT_MAX_CONCURRENT_REQUESTS  # noqa: E402
+from mock_tv import MockVizioTV  # noqa: E402
+
+
+def load_capture(path: str) -> list[dict[str, Any]]:
+    """Return the requests in a capture file (all sessions)."""
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        entries = [json.loads(line) for line in file if line.strip()]
+    # Skip the session headers
+    return [entry for entry in entries if "method" in entry]
+
+
+class ReplayTV(MockVizioTV):
+    """Answers requests with the responses from a capture."""
+
+    def __init__(self, entries: list[dict[str, Any]], realtime: bool) -> None:
+        """Initialize replay TV."""
+        super().__init__()
+        self._realtime = realtime
+        self._responses: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for entry in entries:
+            self._responses[f"{entry['method']} {entry['path']}"].append(entry)
+        self._served: Counter[str] = Counter()
+        # Requests the capture has no response for
+        self.unmatched: Counter[str] = Counter()
+
+    async def _replay(self, request: web.Request) -> web.StreamResponse:
+        key = f"{request.method} {request.path_qs}"
+        entries = self._responses.get(key)
+        if not entries:
+            self.unmatched[key] += 1
+            return self._fail("URI_NOT_FOUND", "not in capture")
+        entry = entries[self._served[key] % len(entries)]
+        self._served[key] += 1
+
+        if "error" in entry:
+            await asyncio.sleep(3600)
+        if self._realtime:
+            await asyncio.sleep(entry["ms"] / 1000)
+        if isinstance(entry["response"], str):
+            return web.Response(text=entry["response"], status=entry["status"])
+        return web.json_response(entry["response"], status=entry["status"])
+
+    def build_app(self) -> web.Application:
+        """Return an aiohttp application that replays every path."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_route("*", "/{tail:.*}", self._replay)
+        return app
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run the replay."""
+    entries = load_capture(args.capture)
+    print(f"{len(entries)} captured requests, {len({e['path'] for e in entries})} paths")
+    tv = ReplayTV(entries, args.realtime)
+    port = await tv.async_start()
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await create_hass(config_dir)
+        coordinator = create_coordinator(
+            hass, port, tv.token, args.max_concurrent, DEFAULT_ENTITY_KEYS
+        )
+        profiler = cProfile.Profile() if args.profile else None
+        try:
+            if profiler:
+                profiler.enable()
+            await bench_polls(coordinator, tv, args.cycles, full=True)
+            await bench_polls(coordinator, tv, args.cycles, full=False)
+            if args.commands:
+                await bench_commands(hass, coordinator, tv, args.commands)
+            if profiler:
+                profiler.disable()
+                print()
+                pstats.Stats(profiler).sort_stats(args.sort).print_stats(args.top)
+
+            if tv.unmatched:
+                print("\nRequests not in the capture (answered URI_NOT_FOUND):")
+                for endpoint, count in tv.unmatched.most_common():
+                    print(f"  {count:6d}  {endpoint}")
+        finally:
+            await coordinator.client.async_close()
+            await tv.async_stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("capture", help="capture file (.jsonl.gz)")
+    parser.add_argument("--cycles", type=int, default=50, help="poll cycles per run")
+    parser.add_argument(
+        "--commands", type=int, default=20, help="commands per entity path (0 to skip)"
+    )
+    parser.add_argument(
+        "--realtime", action="store_true", help="answer after each request's captured latency"
+    )
+    parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENT_REQUESTS,
+        help="max_concurrent_requests for the coordinator",
+    )
+    parser.add_argument("--profile", action="store_true", help="run under cProfile")
+    parser.add_argument("--sort", default="cumulative", help="cProfile sort key")
+    parser.add_argument("--top", type=int, default=30, help="profile lines to print")
+    asyncio.run(main(parser.parse_args()))
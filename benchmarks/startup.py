@@ -0,0 +1,124 @@
+"""Startup time benchmark against a slow, hanging or unreachable mock TV.
+
+Runs the integration's async_setup the way Home Assistant does at startup
+and reports how long it takes to return, how much state the entities have
+when it does, and when the first poll (which runs in the background)
+finishes. Each scenario is run twice: cold (nothing cached on disk) and
+warm (last known state saved by a previous run against a healthy TV).
+
+Entity platforms aren't loaded (that needs a full Home Assistant); their
+setup doesn't touch the TV. Run from the repository root:
+    python benchmarks/startup.py --latency-ms 500
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import socket
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from homeassistant.const import (  # noqa: E402
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+    EVENT_HOMEASSISTANT_STOP,
+)
+from homeassistant.helpers import discovery  # noqa: E402
+
+from bench import create_hass  # noqa: E402
+from custom_components.vizio_local import async_setup  # noqa: E402
+from custom_components.vizio_local.const import DOMAIN  # noqa: E402
+from mock_tv import MockOptions, MockVizioTV  # noqa: E402
+
+# Longest to wait for the first poll to finish
+FIRST_POLL_TIMEOUT = 30
+
+
+async def _async_skip_platform(*args, **kwargs) -> None:
+    """Stand-in for discovery.async_load_platform."""
+
+
+def unused_port() -> int:
+    """Return a local port nothing is listening on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def run_setup(config_dir: str, port: int, token: str, timeout: float) -> dict[str, float]:
+    """Set up the integration once and time it."""
+    hass = await create_hass(config_dir)
+    config = {
+        DOMAIN: {
+            "host": "127.0.0.1",
+            "port": port,
+            "access_token": token,
+            "request_timeout": timeout,
+        }
+    }
+
+    start = time.perf_counter()
+    assert await async_setup(hass, config)
+    setup_ms = (time.perf_counter() - start) * 1000
+
+    coordinator = next(iter(hass.data[DOMAIN]["devices"].values()))["coordinator"]
+    keys_at_setup = len(coordinator.data or {})
+
+    deadline = start + FIRST_POLL_TIMEOUT
+    while not coordinator.cycle_stats.count and time.perf_counter() < deadline:
+        await asyncio.sleep(0.01)
+    first_poll_ms = (time.perf_counter() - start) * 1000
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    return {"setup_ms": setup_ms, "keys": keys_at_setup, "first_poll_ms": first_poll_ms}
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run the benchmark."""
+    discovery.async_load_platform = _async_skip_platform
+
+    healthy = MockVizioTV()
+    healthy_port = await healthy.async_start()
+    slow = MockVizioTV(MockOptions(latency_ms=args.latency_ms), token=healthy.token)
+    slow_port = await slow.async_start()
+    hanging = MockVizioTV(MockOptions(hang_rate=1.0), token=healthy.token)
+    hanging_port = await hanging.async_start()
+    scenarios = {
+        f"slow ({args.latency_ms:.0f} ms/request)": slow_port,
+        f"hanging ({args.request_timeout:.0f} s timeout)": hanging_port,
+        "unreachable": unused_port(),
+    }
+
+    print(f"{'scenario':<28} {'cache':<5} {'setup':>9} {'keys':>5} {'first poll':>11}")
+    try:
+        for name, port in scenarios.items():
+            for warm in (False, True):
+                with tempfile.TemporaryDirectory() as config_dir:
+                    if warm:
+                        # A previous run while the TV was fine
+                        await run_setup(config_dir, healthy_port, healthy.token, args.request_timeout)
+                    result = await run_setup(config_dir, port, healthy.token, args.request_timeout)
+                print(
+                    f"{name:<28} {'warm' if warm else 'cold':<5} "
+                    f"{result['setup_ms']:7.1f} ms {result['keys']:5d} "
+                    f"{result['first_poll_ms']:8.1f} ms"
+                )
+    finally:
+        for tv in (healthy, slow, hanging):
+            await tv.async_stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency-ms", type=float, default=500.0, help="latency of the slow TV")
+    parser.add_argument(
+        "--request-timeout", type=float, default=3.0, help="request_timeout for the integration"
+    )
+    asyncio.run(main(parser.parse_args()))
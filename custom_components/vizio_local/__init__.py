@@ -1,21 +1,55 @@
 """Vizio Local Control integration."""
 from __future__ import annotations
 
+from functools import partial
 import logging
-from datetime import timedelta
 
-from pyvizio import VizioAsync
-
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import Event, HomeAssistant, SupportsResponse
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.helpers import discovery
+from homeassistant.util import slugify
+
+from .apps import AppCatalog
+from .client import VizioLocalClient
+from .const import (
+    CONF_CAPTURE,
+    CONF_DEVICES,
+    CONF_DIAGNOSTIC_SENSORS,
+    CONF_FAILURE_THRESHOLD,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_MAX_KEYS_PER_REQUEST,
+    CONF_MAX_TOTAL_CONCURRENT_REQUESTS,
+    CONF_POLL_INTERVALS,
+    CONF_PRESETS,
+    CONF_REQUEST_TIMEOUT,
+    DEFAULT_DEVICE_NAME,
+    DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MAX_KEYS_PER_REQUEST,
+    DEFAULT_MAX_TOTAL_CONCURRENT_REQUESTS,
+    DEFAULT_PORT,
+    DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_UNIQUE_ID_PREFIX,
+    DOMAIN,
+    SERVICE_APPLY_PICTURE_PRESET,
+    SERVICE_GET_DIAGNOSTICS,
+)
+from .coordinator import VizioLocalCoordinator
+from .diagnostics import async_handle_get_diagnostics
+from .last_state import LastStateCache
+from .presets import (
+    APPLY_PICTURE_PRESET_SCHEMA,
+    async_handle_apply_picture_preset,
+    validate_presets,
+)
+from .registry import SettingsRegistry, SettingsSchemaCache
+from .scheduler import PollScheduler
+from .sources import SourceListCache
 
 _LOGGER = logging.getLogger(__name__)
 
-DOMAIN = "vizio_local"
-PLATFORMS = [Platform.NUMBER, Platform.SELECT, Platform.SWITCH]
+PLATFORMS = [Platform.NUMBER, Platform.REMOTE, Platform.SELECT, Platform.SWITCH]
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up from configuration.yaml."""
@@ -23,114 +57,177 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         return True
 
     conf = config[DOMAIN]
-    host = conf.get("host")
-    port = conf.get("port", 7345)
-    token = conf.get("access_token")
-
-    if not host or not token:
-        _LOGGER.error("Missing required configuration: host and access_token")
-        return False
-
-    # Create Vizio client
-    vizio = VizioAsync("0.0.0.0", f"{host}:{port}", "Vizio Greg", token, "tv")
-
-    async def async_update_data():
-        """Fetch data from Vizio."""
-        data = {}
-
-        # Get picture settings
-        for setting in ["backlight", "brightness", "contrast", "color", "tint", "sharpness"]:
-            try:
-                item = await vizio.get_setting("picture", setting, log_api_exception=False)
-                if item:
-                    # Handle both Item objects and raw values
-                    if hasattr(item, 'value'):
-                        data[f"picture_{setting}"] = item.value
-                        data[f"picture_{setting}_hash"] = item.id
-                    else:
-                        data[f"picture_{setting}"] = item
-                    _LOGGER.debug(f"Got picture {setting}: {data.get(f'picture_{setting}')}")
-            except Exception as e:
-                _LOGGER.warning(f"Failed to get picture {setting}: {e}")
-
-        # Get audio settings
-        for setting in ["volume", "mute"]:
-            try:
-                item = await vizio.get_setting("audio", setting, log_api_exception=False)
-                if item:
-                    # Handle both Item objects and raw values
-                    if hasattr(item, 'value'):
-                        data[f"audio_{setting}"] = item.value
-                        data[f"audio_{setting}_hash"] = item.id
-                    else:
-                        data[f"audio_{setting}"] = item
-                    _LOGGER.debug(f"Got audio {setting}: {data.get(f'audio_{setting}')}")
-                else:
-                    _LOGGER.warning(f"No data returned for audio {setting}")
-            except Exception as e:
-                _LOGGER.warning(f"Failed to get audio {setting}: {e}")
-
-        # Get current input/app
-        try:
-            current_input = await vizio.get_current_input(log_api_exception=False)
-
-            # If on SmartCast input, get the actual app name
-            if current_input == "SMARTCAST":
-                current_app = await vizio.get_current_app(log_api_exception=False)
-                if current_app and current_app != "_UNKNOWN_APP":
-                    data["current_source"] = current_app
-                    _LOGGER.debug(f"Current source: {current_app} (app)")
-                else:
-                    data["current_source"] = current_input
-                    _LOGGER.debug(f"Current source: {current_input}")
-            elif current_input:
-                data["current_source"] = current_input
-                _LOGGER.debug(f"Current source: {current_input} (input)")
-        except Exception as e:
-            _LOGGER.warning(f"Failed to get current input/app: {e}")
-
-        # Get power state
-        try:
-            power_state = await vizio.get_power_state(log_api_exception=False)
-            data["power_state"] = power_state
-            _LOGGER.debug(f"Power state: {power_state}")
-        except Exception as e:
-            _LOGGER.warning(f"Failed to get power state: {e}")
-
-        # Get power mode (Eco Mode vs Quick Start) - needed for power switch
-        try:
-            item = await vizio.get_setting("system", "power_mode", log_api_exception=False)
-            if item:
-                if hasattr(item, 'value'):
-                    data["power_mode"] = item.value
-                else:
-                    data["power_mode"] = item
-                _LOGGER.debug(f"Power mode: {data.get('power_mode')}")
-        except Exception as e:
-            _LOGGER.warning(f"Failed to get power mode: {e}")
-
-        _LOGGER.info(f"Coordinator update complete. Data keys: {list(data.keys())}")
-        return data
-
-    coordinator = DataUpdateCoordinator(
+
+    if CONF_DEVICES in conf:
+        device_confs = conf[CONF_DEVICES]
+    else:
+        # Original single-TV format: host/access_token directly under vizio_local
+        device_confs = [conf]
+
+    scheduler = PollScheduler(
         hass,
-        _LOGGER,
-        name="vizio_local",
-        update_method=async_update_data,
-        update_interval=timedelta(seconds=10),
+        conf.get(CONF_MAX_TOTAL_CONCURRENT_REQUESTS, DEFAULT_MAX_TOTAL_CONCURRENT_REQUESTS),
     )
+    devices = {}
+    # Known apps, shared by all TVs
+    app_catalog = AppCatalog(hass)
+
+    # Check every TV's configuration before opening any connection pools,
+    # so a bad entry doesn't leave earlier TVs' sessions open
+    names: list[tuple[str, str]] = []
+    for device_conf in device_confs:
+        host = device_conf.get("host")
+        token = device_conf.get("access_token")
+
+        if not host or not token:
+            _LOGGER.error("Missing required configuration: host and access_token")
+            return False
+
+        if CONF_DEVICES in conf:
+            name = device_conf.get("name", f"Vizio {host}")
+            device_id = slugify(name)
+        else:
+            name = DEFAULT_DEVICE_NAME
+            device_id = DEFAULT_UNIQUE_ID_PREFIX
+
+        if any(device_id == known_id for _, known_id in names):
+            _LOGGER.error(f"Duplicate Vizio device name: {name}")
+            return False
+        names.append((name, device_id))
+
+    for device_conf, (name, device_id) in zip(device_confs, names):
+        host = device_conf["host"]
+        port = device_conf.get("port", DEFAULT_PORT)
+        token = device_conf["access_token"]
+        if CONF_DEVICES in conf:
+            unique_id_prefix = f"{DEFAULT_UNIQUE_ID_PREFIX}_{device_id}"
+        else:
+            unique_id_prefix = DEFAULT_UNIQUE_ID_PREFIX
+
+        # Per-TV settings fall back to the top-level ones
+        max_concurrent = device_conf.get(
+            CONF_MAX_CONCURRENT_REQUESTS,
+            conf.get(CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS),
+        )
+        poll_intervals = {
+            **conf.get(CONF_POLL_INTERVALS, {}),
+            **device_conf.get(CONF_POLL_INTERVALS, {}),
+        }
+        request_timeout = device_conf.get(
+            CONF_REQUEST_TIMEOUT, conf.get(CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT)
+        )
+        failure_threshold = device_conf.get(
+            CONF_FAILURE_THRESHOLD, conf.get(CONF_FAILURE_THRESHOLD, DEFAULT_FAILURE_THRESHOLD)
+        )
+        max_keys_per_request = device_conf.get(
+            CONF_MAX_KEYS_PER_REQUEST,
+            conf.get(CONF_MAX_KEYS_PER_REQUEST, DEFAULT_MAX_KEYS_PER_REQUEST),
+        )
+        capture_path = None
+        if device_conf.get(CONF_CAPTURE, conf.get(CONF_CAPTURE, False)):
+            capture_path = hass.config.path(f"{DOMAIN}_capture_{device_id}.jsonl.gz")
+            _LOGGER.warning(f"Capturing all traffic to {name} in {capture_path}")
+
+        # Create Vizio client. Its keep-alive connection pool is shared by the
+        # coordinator and all of this TV's entities, and sized to the in-flight limit.
+        client = VizioLocalClient(
+            host,
+            port,
+            token,
+            pool_size=max_concurrent,
+            timeout=request_timeout,
+            max_keys_per_request=max_keys_per_request,
+            capture_path=capture_path,
+        )
 
-    await coordinator.async_refresh()
+        coordinator = VizioLocalCoordinator(
+            hass,
+            client,
+            name,
+            unique_id_prefix,
+            max_concurrent,
+            scheduler.request_limit,
+            poll_intervals,
+            failure_threshold,
+            app_catalog,
+        )
+        scheduler.async_add(coordinator)
+
+        devices[device_id] = {
+            "coordinator": coordinator,
+            "client": client,
+            "vizio": client.vizio,
+        }
+
+    async def async_stop(event: Event) -> None:
+        """Stop polling and close connection pools when Home Assistant stops."""
+        scheduler.async_stop()
+        app_catalog.async_stop()
+        for device in devices.values():
+            if "settings" in device:
+                device["settings"].async_stop()
+            await device["client"].async_close()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_stop)
+
+    # Entities start out with each TV's last known state; the first poll
+    # runs in the background (scheduler.async_start below) so a slow or
+    # unreachable TV doesn't hold up Home Assistant's startup
+    last_state = LastStateCache(hass)
+    await last_state.async_load()
+    for device in devices.values():
+        last_state.async_track(device["coordinator"])
+
+    source_cache = SourceListCache(hass)
+    await source_cache.async_load()
+    await app_catalog.async_load()
+
+    # Each TV's settings (and so its number/select/switch entities) come
+    # from its settings menu, read once and cached
+    settings_cache = SettingsSchemaCache(hass)
+    await settings_cache.async_load()
+    for device in devices.values():
+        device["settings"] = SettingsRegistry(
+            hass, device["coordinator"], device["client"], settings_cache
+        )
+        device["settings"].async_start()
 
     hass.data[DOMAIN] = {
-        "coordinator": coordinator,
-        "vizio": vizio,
+        "devices": devices,
+        "scheduler": scheduler,
+        "source_cache": source_cache,
+        "apps": app_catalog,
+        "last_state": last_state,
+        "presets": validate_presets(conf.get(CONF_PRESETS, {})),
     }
 
-    # Load platforms
-    for platform in PLATFORMS:
-        hass.async_create_task(
-            discovery.async_load_platform(hass, platform, DOMAIN, {}, config)
-        )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_DIAGNOSTICS,
+        partial(async_handle_get_diagnostics, hass),
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY_PICTURE_PRESET,
+        partial(async_handle_apply_picture_preset, hass),
+        schema=APPLY_PICTURE_PRESET_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    platforms = list(PLATFORMS)
+    if conf.get(CONF_DIAGNOSTIC_SENSORS, False):
+        platforms.append(Platform.SENSOR)
+
+    # Load platforms for each TV
+    for device_id in devices:
+        for platform in platforms:
+            hass.async_create_task(
+                discovery.async_load_platform(
+                    hass, platform, DOMAIN, {"device_id": device_id}, config
+                )
+            )
+
+    scheduler.async_start()
 
     return True
@@ -0,0 +1,119 @@
+"""Vizio SmartCast API commands not provided by pyvizio."""
+from __future__ import annotations
+
+from typing import Any, NamedTuple
+
+from pyvizio.api._protocol import (
+    ENDPOINT,
+    TYPE_LIST,
+    TYPE_MENU,
+    TYPE_SLIDER,
+    TYPE_VALUE,
+    TYPE_X_LIST,
+    ResponseKey,
+)
+from pyvizio.api.base import InfoCommandBase
+from pyvizio.api.item import Item
+from pyvizio.api.settings import ChangeSettingCommand
+from pyvizio.helpers import dict_get_case_insensitive
+
+# Item types that hold a readable/settable value (as opposed to sub-menus).
+# Many firmwares list enumerated settings (picture mode, color temperature)
+# as X lists.
+VALUE_TYPES = (TYPE_LIST, TYPE_X_LIST, TYPE_SLIDER, TYPE_VALUE)
+
+# Menu responses list the HASHVAL of every item under this key
+HASHLIST = "HASHLIST"
+
+
+def coerce_value(value: Any) -> Any:
+    """Coerce a setting value to int if possible (same as pyvizio's get_setting)."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return value
+
+
+class SettingsGroup(NamedTuple):
+    """A settings group as read from the TV."""
+
+    # HASHVALs of the group's items (None if the TV didn't send them)
+    hashlist: tuple[int, ...] | None
+    # Value items keyed by CNAME, or None if hashlist matched the known one
+    items: dict[str, Item] | None
+
+
+class GetSettingsGroupCommand(InfoCommandBase):
+    """Command to get every item in a settings group (e.g. picture) at once.
+
+    An item's HASHVAL changes whenever its value does, so if the response's
+    HASHLIST equals known_hashlist nothing in the group changed and its
+    items aren't parsed.
+    """
+
+    def __init__(
+        self,
+        device_type: str,
+        setting_type: str,
+        known_hashlist: tuple[int, ...] | None = None,
+    ) -> None:
+        """Initialize command to get every item in a settings group."""
+        super().__init__(f"{ENDPOINT[device_type]['SETTINGS']}/{setting_type}")
+        self.setting_type = setting_type.lower()
+        self.known_hashlist = known_hashlist
+
+    def process_response(self, json_obj: dict[str, Any]) -> SettingsGroup:
+        """Return the group's HASHLIST and value items keyed by CNAME."""
+        hashlist = dict_get_case_insensitive(json_obj, HASHLIST)
+        hashlist = tuple(hashlist) if hashlist else None
+        if hashlist is not None and hashlist == self.known_hashlist:
+            return SettingsGroup(hashlist, None)
+
+        items = [
+            Item(item)
+            for item in dict_get_case_insensitive(json_obj, ResponseKey.ITEMS, [])
+        ]
+        return SettingsGroup(
+            hashlist,
+            {
+                item.c_name: item
+                for item in items
+                if item.c_name and item.type and item.type.lower() in VALUE_TYPES
+            },
+        )
+
+
+class GetSettingsMenusCommand(InfoCommandBase):
+    """Command to list the settings groups (sub-menus) of the settings menu."""
+
+    def __init__(self, device_type: str) -> None:
+        """Initialize command to list the settings groups."""
+        super().__init__(ENDPOINT[device_type]["SETTINGS"])
+
+    def process_response(self, json_obj: dict[str, Any]) -> list[str]:
+        """Return the CNAMEs of the menu's sub-menus, e.g. ["picture", "audio", ...]."""
+        items = [
+            Item(item)
+            for item in dict_get_case_insensitive(json_obj, ResponseKey.ITEMS, [])
+        ]
+        return [
+            item.c_name
+            for item in items
+            if item.c_name and item.type and item.type.lower() == TYPE_MENU
+        ]
+
+
+class ModifySettingCommand(ChangeSettingCommand):
+    """Command to set a setting with a known HASHVAL, returning the new HASHVAL.
+
+    Note: pyvizio serializes every instance attribute into the PUT body, so
+    don't add attributes here.
+    """
+
+    def process_response(self, json_obj: dict[str, Any]) -> int | bool:
+        """Return the setting's new HASHVAL if the TV sent one, else True."""
+        for item in dict_get_case_insensitive(json_obj, ResponseKey.ITEMS, []):
+            hashval = dict_get_case_insensitive(item, ResponseKey.HASHVAL)
+            if hashval is not None:
+                return int(hashval)
+        return True
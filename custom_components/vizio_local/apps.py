@@ -0,0 +1,177 @@
+"""Catalog of known SmartCast apps, cached on disk and indexed for lookups."""
+from __future__ import annotations
+
+from datetime import datetime
+import logging
+from typing import Any
+
+import aiohttp
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from pyvizio.api.apps import AppConfig
+from pyvizio.const import (
+    APP_CAST,
+    APP_HOME,
+    APPS,
+    EQUIVALENT_NAME_SPACES,
+    NO_APP_RUNNING,
+    UNKNOWN_APP,
+)
+from pyvizio.util import gen_apps_list_from_url
+
+from .const import APP_CATALOG_TTL, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.apps"
+
+# Seconds to batch writes to disk
+SAVE_DELAY = 10
+
+
+class AppCatalog:
+    """App definitions (name -> launch configs), shared by all TVs.
+
+    pyvizio downloads the app list from the web and scans it for every
+    current-app lookup and app launch. The catalog downloads it once,
+    stores it in Home Assistant's .storage, re-fetches it in the background
+    when older than APP_CATALOG_TTL (at startup, then every
+    APP_CATALOG_TTL while running), and indexes it by (APP_ID, NAME_SPACE)
+    and by name. Until the first download, pyvizio's built-in list is used.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize catalog."""
+        self._hass = hass
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._updated: str | None = None
+        self._by_config: dict[tuple[str, int], str] = {}
+        # APP_ID -> name for configs in one of the EQUIVALENT_NAME_SPACES
+        self._by_equivalent_config: dict[str, str] = {}
+        self._by_name: dict[str, dict[str, Any]] = {}
+        self.names: list[str] = []
+        self._listeners: list[CALLBACK_TYPE] = []
+        self._unsub_refresh: CALLBACK_TYPE | None = None
+        self._async_index(APPS)
+
+    async def async_load(self) -> None:
+        """Load the cached catalog from disk, re-fetching it if stale."""
+        data = await self._store.async_load()
+        if data:
+            self._updated = data["updated"]
+            self._async_index(data["apps"])
+        _LOGGER.debug(f"Loaded app catalog with {len(self.names)} apps")
+        if not self.is_fresh:
+            self._async_start_fetch()
+        self._unsub_refresh = async_track_time_interval(
+            self._hass, self._async_refresh, APP_CATALOG_TTL
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop the periodic refresh."""
+        if self._unsub_refresh is not None:
+            self._unsub_refresh()
+            self._unsub_refresh = None
+
+    @callback
+    def _async_refresh(self, _now: datetime) -> None:
+        """Re-download the catalog (every APP_CATALOG_TTL)."""
+        self._async_start_fetch()
+
+    @callback
+    def _async_start_fetch(self) -> None:
+        """Download the app list in the background."""
+        self._hass.async_create_background_task(self._async_fetch(), f"{DOMAIN} app catalog")
+
+    @property
+    def is_fresh(self) -> bool:
+        """Return True if the catalog was downloaded within APP_CATALOG_TTL."""
+        updated = dt_util.parse_datetime(self._updated) if self._updated else None
+        return updated is not None and dt_util.utcnow() - updated < APP_CATALOG_TTL
+
+    async def _async_fetch(self) -> None:
+        """Download the app list and store it."""
+        try:
+            apps = await gen_apps_list_from_url(session=async_get_clientsession(self._hass))
+        except (TimeoutError, aiohttp.ClientError, ValueError) as e:
+            _LOGGER.debug(f"App list download failed: {e!r}")
+            apps = None
+        if not apps:
+            _LOGGER.warning("Couldn't download the app list, using the cached one")
+            return
+        self._updated = dt_util.utcnow().isoformat()
+        self._async_index(apps)
+        self._store.async_delay_save(
+            lambda: {"apps": apps, "updated": self._updated}, SAVE_DELAY
+        )
+        _LOGGER.debug(f"Downloaded app catalog with {len(self.names)} apps")
+        for listener in list(self._listeners):
+            listener()
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Call update_callback whenever a download updates the catalog.
+
+        Returns a function that removes the listener.
+        """
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_index(self, apps: list[dict[str, Any]]) -> None:
+        """Rebuild the lookup tables from pyvizio-style app definitions."""
+        by_config: dict[tuple[str, int], str] = {}
+        by_equivalent_config: dict[str, str] = {}
+        by_name: dict[str, dict[str, Any]] = {}
+        for app in [APP_HOME, *apps]:
+            configs = app["config"] if isinstance(app["config"], list) else [app["config"]]
+            if not configs:
+                continue
+            name = str(app["name"])
+            # First definition wins, as with pyvizio's list scan
+            by_name.setdefault(name.lower(), {"name": name, "config": configs[0]})
+            for config in configs:
+                by_config.setdefault((config["APP_ID"], config["NAME_SPACE"]), name)
+                if config["NAME_SPACE"] in EQUIVALENT_NAME_SPACES:
+                    by_equivalent_config.setdefault(config["APP_ID"], name)
+
+        self._by_config = by_config
+        self._by_equivalent_config = by_equivalent_config
+        self._by_name = by_name
+        home = APP_HOME["name"]
+        self.names = [home, *sorted(app["name"] for app in by_name.values() if app["name"] != home)]
+
+    def __contains__(self, name: str) -> bool:
+        """Return True if name is a known app."""
+        return name.lower() in self._by_name
+
+    def get_config(self, name: str) -> dict[str, Any] | None:
+        """Return the launch config (APP_ID, NAME_SPACE, MESSAGE) of an app."""
+        app = self._by_name.get(name.lower())
+        return app["config"] if app else None
+
+    def resolve(self, config: AppConfig | None) -> str:
+        """Return the name of the app with a running app's config.
+
+        Same results as pyvizio's find_app_name: NO_APP_RUNNING for an
+        empty config, UNKNOWN_APP if no known app has it.
+        """
+        if not config:
+            return NO_APP_RUNNING
+        name = self._by_config.get((config.APP_ID, config.NAME_SPACE))
+        if name is None and config.NAME_SPACE in EQUIVALENT_NAME_SPACES:
+            name = self._by_equivalent_config.get(config.APP_ID)
+        if name is None and config.NAME_SPACE == 0:
+            # So far only the SmartCast home screen uses NAME_SPACE 0
+            name = APP_CAST
+        return name or UNKNOWN_APP
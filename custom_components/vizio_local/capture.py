@@ -0,0 +1,121 @@
+"""Opt-in capture of a TV's HTTP traffic, for offline replay (benchmarks/replay.py)."""
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import logging
+import time
+from datetime import datetime, timezone
+from typing import IO, Any
+
+_LOGGER = logging.getLogger(__name__)
+
+CAPTURE_VERSION = 1
+
+# Seconds to batch writes to disk
+FLUSH_DELAY = 5
+
+REDACTED = "**REDACTED**"
+
+
+def decode_body(body: bytes | bytearray | None) -> Any:
+    """Return a request/response body as JSON if it is, else as text."""
+    if not body:
+        return None
+    text = body.decode(errors="replace")
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+class TrafficCapture:
+    """Writes a TV's requests and responses to a gzipped JSON Lines file.
+
+    The first line of each session is a header ({"version", "started"}),
+    then one line per request: when it started (seconds into the session),
+    how long it took, method, path with query, request body, HTTP status and
+    response body, or the error if it raised. Headers aren't recorded and
+    the auth token is redacted wherever else it appears. Lines are buffered
+    and written from an executor thread; sessions append to the same file.
+    """
+
+    def __init__(self, path: str, token: str) -> None:
+        """Initialize capture (the file is opened on first write)."""
+        self.path = path
+        self._token = token
+        self._start = time.monotonic()
+        self._lines: list[str] = []
+        self._file: IO[str] | None = None
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_task: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+        self.requests = 0
+        self._add({"version": CAPTURE_VERSION, "started": datetime.now(timezone.utc).isoformat()})
+
+    def record(
+        self,
+        started: float,
+        elapsed_ms: float,
+        method: str,
+        path: str,
+        request: Any,
+        status: int | None = None,
+        response: Any = None,
+        error: str | None = None,
+    ) -> None:
+        """Add one request (started is a time.monotonic() value)."""
+        self.requests += 1
+        entry = {
+            "t": round(started - self._start, 3),
+            "ms": round(elapsed_ms, 1),
+            "method": method,
+            "path": path,
+            "request": request,
+        }
+        if error is None:
+            entry.update(status=status, response=response)
+        else:
+            entry["error"] = error
+        self._add(entry)
+
+    def _add(self, entry: dict[str, Any]) -> None:
+        """Buffer a line and schedule a flush."""
+        line = json.dumps(entry, separators=(",", ":"))
+        if self._token:
+            line = line.replace(self._token, REDACTED)
+        self._lines.append(line)
+        if self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(FLUSH_DELAY, self._start_flush)
+
+    def _start_flush(self) -> None:
+        """Flush in a task (from the timer)."""
+        self._flush_handle = None
+        self._flush_task = asyncio.get_running_loop().create_task(self.async_flush())
+
+    async def async_flush(self) -> None:
+        """Write buffered lines to disk."""
+        async with self._lock:
+            lines, self._lines = self._lines, []
+            if lines:
+                await asyncio.get_running_loop().run_in_executor(None, self._write, lines)
+
+    def _write(self, lines: list[str]) -> None:
+        """Append lines to the file (runs in an executor thread)."""
+        if self._file is None:
+            self._file = gzip.open(self.path, "at", encoding="utf-8")
+        self._file.write("".join(f"{line}\n" for line in lines))
+        self._file.flush()
+
+    async def async_close(self) -> None:
+        """Write what's left and close the file."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        await self.async_flush()
+        if self._file is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self._file.close)
+            self._file = None
+        _LOGGER.info(f"Captured {self.requests} requests to {self.path}")
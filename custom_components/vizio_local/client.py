@@ -0,0 +1,398 @@
+"""Vizio client backed by one shared, long-lived HTTPS session."""
+from __future__ import annotations
+
+import asyncio
+from contextvars import ContextVar
+import logging
+import time
+from types import SimpleNamespace
+from typing import Any, Awaitable, TypeVar
+
+import aiohttp
+from pyvizio import VizioAsync
+from pyvizio.api._protocol import KEY_CODE, STATUS_SUCCESS, async_invoke_api_auth
+from pyvizio.api.base import CommandBase
+from pyvizio.api.item import Item
+from pyvizio.api.remote import EmulateRemoteCommand
+from pyvizio.api.settings import GetSettingCommand
+from pyvizio.helpers import dict_get_case_insensitive
+
+from .api import (
+    GetSettingsGroupCommand,
+    GetSettingsMenusCommand,
+    ModifySettingCommand,
+    SettingsGroup,
+)
+from .capture import TrafficCapture, decode_body
+from .const import DEFAULT_MAX_KEYS_PER_REQUEST
+from .stats import LatencyStats
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds an idle connection is kept open for reuse. The coordinator polls
+# every 10 seconds, so this keeps the connection alive between cycles.
+KEEPALIVE_TIMEOUT = 30
+
+_T = TypeVar("_T")
+
+
+
+class _BoundedRequests:
+    """Requests sent within one async_invoke or async_call.
+
+    Their outcome isn't known when the trace hooks run: async_invoke
+    records completed requests once pyvizio's result is parsed, and a
+    request cancelled by the client's timeout is only known to have timed
+    out once asyncio.timeout raises. Entries are (method, url, elapsed ms).
+    """
+
+    def __init__(self, by_result: bool) -> None:
+        """Initialize; with by_result, completed requests wait for the result."""
+        self.by_result = by_result
+        self.completed: list[tuple[str, Any, float]] = []
+        self.cancelled: list[tuple[str, Any, float]] = []
+
+
+# The running async_invoke or async_call, if any
+_BOUNDED_REQUESTS: ContextVar[_BoundedRequests | None] = ContextVar(
+    "vizio_local_bounded_requests", default=None
+)
+
+
+class VizioLocalClient:
+    """Vizio TV client sharing one keep-alive connection pool.
+
+    Every request - coordinator polls and entity commands alike - goes
+    through the same aiohttp session, so the TLS handshake to the TV only
+    happens when the pool opens a new connection instead of on every call.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        token: str,
+        pool_size: int,
+        timeout: float,
+        max_keys_per_request: int = DEFAULT_MAX_KEYS_PER_REQUEST,
+        capture_path: str | None = None,
+    ) -> None:
+        """Initialize client and its connection pool.
+
+        timeout (seconds) applies to every request sent through the client.
+        With capture_path, requests to the TV are recorded there (see
+        TrafficCapture).
+        """
+        self.host = host
+        self.ip = f"{host}:{port}"
+        self._token = token
+        self._timeout = timeout
+        self._max_keys_per_request = max_keys_per_request
+        self.connections_created = 0
+        self.connections_reused = 0
+        # Per-endpoint request stats, keyed by "<METHOD> <path>"
+        self.endpoint_stats: dict[str, LatencyStats] = {}
+        # All requests to this TV combined
+        self.request_stats = LatencyStats()
+        self.capture = TrafficCapture(capture_path, token) if capture_path else None
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(self._on_connection_create)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuse)
+        trace_config.on_request_start.append(self._on_request_start)
+        trace_config.on_request_end.append(self._on_request_end)
+        trace_config.on_request_exception.append(self._on_request_exception)
+        if self.capture is not None:
+            trace_config.on_request_chunk_sent.append(self._on_request_chunk_sent)
+
+        # The pool is bounded so we never hold more sockets open than the
+        # TV is allowed to serve at once. pyvizio passes ssl=False on every
+        # request (TV uses a self-signed certificate).
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=pool_size,
+                limit_per_host=pool_size,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+            ),
+            trace_configs=[trace_config],
+        )
+        self.vizio = VizioAsync(
+            "0.0.0.0",
+            self.ip,
+            "Vizio Greg",
+            token,
+            "tv",
+            session=self.session,
+            timeout=timeout,
+        )
+
+    async def _on_connection_create(
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        """Count new connections (each one costs a TLS handshake)."""
+        self.connections_created += 1
+
+    async def _on_connection_reuse(
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        """Count requests served from an already open connection."""
+        self.connections_reused += 1
+
+    def _record(self, method: str, url: Any, elapsed_ms: float, **outcome: bool) -> None:
+        """Record a request against its endpoint (and the TV's totals)."""
+        if url.host != self.host:
+            # e.g. pyvizio's app list download - keep it out of the TV's totals
+            key = f"{method} {url.host}{url.path}"
+        else:
+            key = f"{method} {url.path}"
+            self.request_stats.record(elapsed_ms, **outcome)
+        self.endpoint_stats.setdefault(key, LatencyStats()).record(elapsed_ms, **outcome)
+
+    async def _on_request_start(
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        """Note when a request started."""
+        context.start = time.monotonic()
+        context.request_body = bytearray()
+
+    async def _on_request_chunk_sent(
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        """Collect the request body for the capture."""
+        context.request_body += params.chunk
+
+    async def _on_request_end(
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        """Record a completed request (and capture it)."""
+        elapsed_ms = (time.monotonic() - context.start) * 1000
+        response = params.response
+        bounded = _BOUNDED_REQUESTS.get()
+        if bounded is not None and bounded.by_result and response.status == 200:
+            # Sent by async_invoke, which records it once the result is parsed
+            bounded.completed.append((params.method, params.url, elapsed_ms))
+        else:
+            failed = response.status != 200
+            if not failed and params.url.host == self.host:
+                # Sent by pyvizio directly (e.g. the power probe, pow_on); the
+                # TV reports most errors (e.g. INVALID_AUTH) with HTTP 200
+                failed = not await self._is_success(response)
+            self._record(params.method, params.url, elapsed_ms, failed=failed)
+        if self.capture is not None and params.url.host == self.host:
+            self.capture.record(
+                context.start,
+                elapsed_ms,
+                params.method,
+                params.url.path_qs,
+                decode_body(context.request_body),
+                status=response.status,
+                response=decode_body(await response.read()),
+            )
+
+    @staticmethod
+    async def _is_success(response: aiohttp.ClientResponse) -> bool:
+        """Return True if a TV response's STATUS.RESULT is SUCCESS.
+
+        The body is cached, so pyvizio can still read it afterwards.
+        """
+        try:
+            body = await response.json(content_type=None)
+            status = dict_get_case_insensitive(body, "status") or {}
+            result = dict_get_case_insensitive(status, "result") or ""
+            return result.lower() == STATUS_SUCCESS
+        except Exception:
+            return False
+
+    async def _on_request_exception(
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        """Record a request that raised (connection error or timeout)."""
+        elapsed_ms = (time.monotonic() - context.start) * 1000
+        bounded = _BOUNDED_REQUESTS.get()
+        if bounded is not None and isinstance(params.exception, asyncio.CancelledError):
+            # Possibly by the client's timeout; recorded once that's known
+            bounded.cancelled.append((params.method, params.url, elapsed_ms))
+        else:
+            timed_out = isinstance(params.exception, asyncio.TimeoutError)
+            self._record(params.method, params.url, elapsed_ms, failed=True, timed_out=timed_out)
+        if self.capture is not None and params.url.host == self.host:
+            self.capture.record(
+                context.start,
+                elapsed_ms,
+                params.method,
+                params.url.path_qs,
+                decode_body(context.request_body),
+                error=type(params.exception).__name__,
+            )
+
+    @property
+    def connection_stats(self) -> dict[str, int]:
+        """Return connection pool usage counts."""
+        return {
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+        }
+
+    async def async_invoke(self, cmd: CommandBase) -> Any:
+        """Send a pyvizio-style command over the shared session.
+
+        Returns None if the request failed or timed out. The TV reports
+        most errors (e.g. stale HASHVAL) with HTTP 200, so the request is
+        recorded as failed when pyvizio couldn't parse a successful result.
+        """
+        bounded = _BoundedRequests(by_result=True)
+        token = _BOUNDED_REQUESTS.set(bounded)
+        result = None
+        timed_out = False
+        try:
+            # pyvizio only applies custom_timeout to GETs, so bound PUTs here
+            async with asyncio.timeout(self._timeout):
+                result = await async_invoke_api_auth(
+                    self.ip,
+                    cmd,
+                    _LOGGER,
+                    auth_token=self._token,
+                    custom_timeout=self._timeout,
+                    log_api_exception=False,
+                    session=self.session,
+                )
+        except TimeoutError:
+            _LOGGER.debug(f"{cmd.get_method()} {cmd.get_url()} timed out")
+            timed_out = True
+        finally:
+            _BOUNDED_REQUESTS.reset(token)
+            self._record_bounded(bounded, result is None, timed_out)
+        return result
+
+    async def async_call(self, call: Awaitable[_T]) -> _T | None:
+        """Await a pyvizio call (e.g. vizio.pow_on()) under the client's timeout.
+
+        pyvizio only applies its timeout to GETs, so commands that PUT
+        (power, input, app launch) need this. Returns None if it timed out.
+        """
+        bounded = _BoundedRequests(by_result=False)
+        token = _BOUNDED_REQUESTS.set(bounded)
+        timed_out = False
+        try:
+            async with asyncio.timeout(self._timeout):
+                return await call
+        except TimeoutError:
+            _LOGGER.debug(f"{getattr(call, '__qualname__', call)} timed out")
+            timed_out = True
+            return None
+        finally:
+            _BOUNDED_REQUESTS.reset(token)
+            self._record_bounded(bounded, False, timed_out)
+
+    def _record_bounded(self, bounded: _BoundedRequests, failed: bool, timed_out: bool) -> None:
+        """Record the requests of an async_invoke or async_call once it's done.
+
+        failed is the outcome of its completed requests; cancelled ones
+        failed, and timed out if the client's timeout cancelled them.
+        """
+        for method, url, elapsed_ms in bounded.completed:
+            self._record(method, url, elapsed_ms, failed=failed)
+        for method, url, elapsed_ms in bounded.cancelled:
+            self._record(method, url, elapsed_ms, failed=True, timed_out=timed_out)
+
+    async def async_get_settings_group(
+        self, setting_type: str, known_hashlist: tuple[int, ...] | None = None
+    ) -> SettingsGroup | None:
+        """Fetch a whole settings group in a single request.
+
+        If the group's HASHLIST equals known_hashlist, its items aren't
+        parsed (items is None).
+        """
+        return await self.async_invoke(
+            GetSettingsGroupCommand(self.vizio.device_type, setting_type, known_hashlist)
+        )
+
+    async def async_get_settings_menus(self) -> list[str] | None:
+        """List the settings groups the TV has (picture, audio, timers, ...)."""
+        return await self.async_invoke(GetSettingsMenusCommand(self.vizio.device_type))
+
+    async def async_get_setting(self, setting_type: str, setting_name: str) -> Item | None:
+        """Fetch a single setting's item (value and HASHVAL)."""
+        item = await self.async_invoke(
+            GetSettingCommand(self.vizio.device_type, setting_type, setting_name)
+        )
+        # pyvizio returns a placeholder item without a HASHVAL when not found
+        if getattr(item, "id", None) is None:
+            return None
+        return item
+
+    async def async_set_setting(
+        self,
+        setting_type: str,
+        setting_name: str,
+        value: int | str,
+        data: dict[str, Any],
+    ) -> bool:
+        """Set a setting using the HASHVAL cached in the coordinator data.
+
+        With a cached hash this is a single PUT. Only if there is no cached
+        hash, or the TV rejects it as stale, do we GET a fresh one and retry.
+        The cached hash in data is replaced with the one the TV returns.
+        """
+        hash_key = f"{setting_type}_{setting_name}_hash"
+        # A HASHVAL is only good for one PUT, so never reuse it
+        hashval = data.pop(hash_key, None)
+
+        if hashval is not None:
+            result = await self._async_put_setting(setting_type, setting_name, value, hashval)
+            if result is not None:
+                if not isinstance(result, bool):
+                    data[hash_key] = result
+                return True
+            _LOGGER.debug(
+                f"Cached HASHVAL for {setting_type}.{setting_name} rejected, fetching a fresh one"
+            )
+
+        item = await self.async_get_setting(setting_type, setting_name)
+        if item is None:
+            _LOGGER.error(f"Couldn't get HASHVAL for {setting_type}.{setting_name}")
+            return False
+
+        result = await self._async_put_setting(setting_type, setting_name, value, item.id)
+        if result is None:
+            return False
+        if not isinstance(result, bool):
+            data[hash_key] = result
+        return True
+
+    async def _async_put_setting(
+        self, setting_type: str, setting_name: str, value: int | str, hashval: int
+    ) -> int | bool | None:
+        """PUT a new setting value. Returns the new HASHVAL, True, or None on failure."""
+        return await self.async_invoke(
+            ModifySettingCommand(
+                self.vizio.device_type, hashval, setting_type, setting_name, value
+            )
+        )
+
+    async def async_send_keys(self, keys: list[str]) -> bool:
+        """Press remote keys (KEY_CODE names, e.g. "UP") in order.
+
+        Keys are packed into KEYLIST requests of up to max_keys_per_request
+        keys each, so a short macro is a single request.
+        """
+        codes = KEY_CODE[self.vizio.device_type]
+        for start in range(0, len(keys), self._max_keys_per_request):
+            batch = keys[start:start + self._max_keys_per_request]
+            result = await self.async_invoke(
+                EmulateRemoteCommand([codes[key] for key in batch], self.vizio.device_type)
+            )
+            if result is None:
+                _LOGGER.error(f"Key press failed: {batch}")
+                return False
+        return True
+
+    async def async_close(self) -> None:
+        """Close the connection pool."""
+        _LOGGER.info(
+            f"Closing Vizio session: {self.connections_created} connections opened, "
+            f"{self.connections_reused} reused"
+        )
+        await self.session.close()
+        if self.capture is not None:
+            await self.capture.async_close()
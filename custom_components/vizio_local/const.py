@@ -0,0 +1,98 @@
+"""Constants for the Vizio Local Control integration."""
+from datetime import timedelta
+
+DOMAIN = "vizio_local"
+
+DEFAULT_PORT = 7345
+
+CONF_DEVICES = "devices"
+
+# Names for a single TV configured directly under vizio_local: (original
+# config format). Keeps the original entity IDs, e.g. switch.vizio_power.
+DEFAULT_DEVICE_NAME = "Vizio"
+DEFAULT_UNIQUE_ID_PREFIX = "vizio"
+
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+
+# Cap on requests in flight across all TVs
+CONF_MAX_TOTAL_CONCURRENT_REQUESTS = "max_total_concurrent_requests"
+DEFAULT_MAX_TOTAL_CONCURRENT_REQUESTS = 16
+
+CONF_POLL_INTERVALS = "poll_intervals"
+
+# How often (seconds) each poll job runs. power_state is the base cycle; the
+# rest run on the first cycle at or after their interval. Settings groups
+# (picture, audio) are read with a single request each; every item in the
+# group ends up in the coordinator data as <group>_<name> and <group>_<name>_hash.
+DEFAULT_POLL_INTERVALS = {
+    "power_state": 5,
+    "current_source": 10,
+    "audio": 10,
+    "picture": 60,
+    "power_mode": 600,
+}
+
+# Poll interval (seconds) for settings groups not in DEFAULT_POLL_INTERVALS
+# (e.g. timers, closed_captions), unless set in poll_intervals
+DEFAULT_SETTINGS_GROUP_POLL_INTERVAL = 60
+
+# Jobs that still run while the TV is off. power_mode is needed to know
+# whether the TV can be woken at all.
+OFF_STATE_POLL_JOBS = {"power_mode"}
+
+# Seconds before a request to the TV is given up on. Kept short so an
+# unreachable TV fails fast instead of tying up the poll cycle.
+CONF_REQUEST_TIMEOUT = "request_timeout"
+DEFAULT_REQUEST_TIMEOUT = 3
+
+# Consecutive failed power probes before a TV is marked unavailable and
+# polled with exponential backoff (power probe only) until it answers again
+CONF_FAILURE_THRESHOLD = "failure_threshold"
+DEFAULT_FAILURE_THRESHOLD = 3
+
+# Longest backoff (seconds) between probes of an unreachable TV
+MAX_BACKOFF_INTERVAL = 300
+
+# Most key presses sent in one KEYLIST request; longer sequences are split
+CONF_MAX_KEYS_PER_REQUEST = "max_keys_per_request"
+DEFAULT_MAX_KEYS_PER_REQUEST = 10
+
+# Timer jitter allowance so a job due "now" isn't pushed back a full cycle
+POLL_INTERVAL_SLACK = 1
+
+# After a power or source command the TV takes a few seconds to settle, so
+# the key is re-read every CONFIRM_POLL_INTERVAL seconds until the TV reports
+# the new value, for at most CONFIRM_POLL_DURATION seconds
+CONFIRM_POLL_INTERVAL = 0.5
+CONFIRM_POLL_DURATION = 5
+
+# How long a cached source list (inputs and apps) is used before it's
+# re-fetched in the background
+SOURCE_LIST_TTL = timedelta(days=1)
+
+# How long the cached app catalog (see apps.py) is used before it's
+# re-downloaded in the background
+APP_CATALOG_TTL = timedelta(days=1)
+
+# How long the cached settings menu schema (see registry.py) is used before
+# it's re-read in the background. It only changes with firmware updates.
+SETTINGS_SCHEMA_TTL = timedelta(days=7)
+
+# Records every request to the TV and its response (token redacted) to
+# <config>/vizio_local_capture_<device>.jsonl.gz, for benchmarks/replay.py
+CONF_CAPTURE = "capture"
+
+# Adds diagnostic sensors (poll cycle time, request latency, failures and
+# timeouts) for each TV
+CONF_DIAGNOSTIC_SENSORS = "diagnostic_sensors"
+
+SERVICE_GET_DIAGNOSTICS = "get_diagnostics"
+
+# Named picture/audio presets for the apply_picture_preset service, e.g.
+# presets: {movie: {picture: {backlight: 40, contrast: 50}}}
+CONF_PRESETS = "presets"
+
+SERVICE_APPLY_PICTURE_PRESET = "apply_picture_preset"
+
+SERVICE_SEND_KEYS = "send_keys"
@@ -0,0 +1,573 @@
+"""Data update coordinator for Vizio Local Control."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import timedelta
+from typing import Any, TypeVar
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from pyvizio.const import NO_APP_RUNNING, UNKNOWN_APP
+
+from .api import coerce_value
+from .apps import AppCatalog
+from .client import VizioLocalClient
+from .const import (
+    CONFIRM_POLL_DURATION,
+    CONFIRM_POLL_INTERVAL,
+    DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_POLL_INTERVALS,
+    DEFAULT_SETTINGS_GROUP_POLL_INTERVAL,
+    DOMAIN,
+    MAX_BACKOFF_INTERVAL,
+    OFF_STATE_POLL_JOBS,
+    POLL_INTERVAL_SLACK,
+)
+from .stats import LatencyStats
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class VizioLocalCoordinator(DataUpdateCoordinator):
+    """Polls the TV and holds the latest data for all entities."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: VizioLocalClient,
+        device_name: str,
+        unique_id_prefix: str,
+        max_concurrent: int,
+        global_request_limit: asyncio.Semaphore,
+        poll_intervals: dict[str, float] | None = None,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        app_catalog: AppCatalog | None = None,
+    ) -> None:
+        """Initialize coordinator.
+
+        Polls are driven by the shared PollScheduler, so the coordinator
+        doesn't schedule itself (update_interval is None). Without an
+        app_catalog, running apps are named by pyvizio.
+        """
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN} {device_name}",
+            update_interval=None,
+        )
+        self.client = client
+        self.vizio = client.vizio
+        # Entity naming for this TV, e.g. "Vizio Power" / "vizio_power"
+        self.device_name = device_name
+        self.unique_id_prefix = unique_id_prefix
+        self.app_catalog = app_catalog
+
+        self._poll_intervals = {**DEFAULT_POLL_INTERVALS, **(poll_intervals or {})}
+        # Known settings: data key -> (group, name), filled in by the SettingsRegistry
+        self.setting_keys: dict[str, tuple[str, str]] = {}
+        # Poll jobs the subscribed entities need; None when it must be rebuilt
+        self._fetch_plan: list[str] | None = None
+        # Monotonic time each poll job last succeeded
+        self._last_polled: dict[str, float] = {}
+        # HASHLIST each settings group's values in data were read with. A poll
+        # that gets the same HASHLIST back keeps the values without parsing.
+        self._group_hashlists: dict[str, tuple[int, ...]] = {}
+        # Settings group reads whose items were parsed / were unchanged
+        self.group_reads = {"parsed": 0, "unchanged": 0}
+        # Commanded values awaiting confirmation (see async_confirm_key)
+        self._pending: dict[str, Any] = {}
+        # Bumped on every local write; the generation each key was last
+        # written in. Reads that started before a key's write don't
+        # overwrite it (see _keep_newer_writes).
+        self._generation = 0
+        self._written: dict[str, int] = {}
+        # Duration of each _async_update_data cycle
+        self.cycle_stats = LatencyStats()
+
+        # Circuit breaker: after failure_threshold failed power probes in a
+        # row the TV is treated as unreachable (see _async_update_data)
+        self._failure_threshold = failure_threshold
+        self._consecutive_failures = 0
+
+        # Change detection: keys whose value changed in the latest update,
+        # or None to notify every listener (see async_update_listeners)
+        self._changed_keys: set[str] | None = None
+        self._last_notified_success = True
+        # Keys that changed / were unchanged (listeners skipped), last update and in total
+        self.last_cycle_changes = {"changed": 0, "skipped": 0}
+        self.total_changes = {"changed": 0, "skipped": 0}
+
+        # Limit how many requests are in flight at once - the TV's web server
+        # falls over if it gets flooded. The global limit is shared by all TVs.
+        self._request_limit = asyncio.Semaphore(max_concurrent)
+        self._global_request_limit = global_request_limit
+
+    @property
+    def is_unreachable(self) -> bool:
+        """Return True while the circuit breaker is open."""
+        return self._consecutive_failures >= self._failure_threshold
+
+    @property
+    def poll_interval(self) -> timedelta:
+        """Return how often the scheduler should run a poll cycle.
+
+        The power probe is the most frequent job, so it drives the cycle.
+        While the TV is unreachable the interval doubles with every failed
+        probe, up to MAX_BACKOFF_INTERVAL.
+        """
+        interval = self._poll_intervals["power_state"]
+        if self.is_unreachable:
+            backoff = 2 ** (self._consecutive_failures - self._failure_threshold + 1)
+            interval = min(interval * backoff, max(interval, MAX_BACKOFF_INTERVAL))
+        return timedelta(seconds=interval)
+
+    async def _fetch_group(self, data: dict, setting_type: str, if_changed: bool = False) -> bool:
+        """Fetch every item of a settings group into data with one request.
+
+        With if_changed, data already holds the group's last values, and
+        they are kept as they are if the group's HASHLIST hasn't changed.
+        """
+        try:
+            known = self._group_hashlists.get(setting_type) if if_changed else None
+            group = await self.client.async_get_settings_group(setting_type, known)
+            if group is not None and group.items is None:
+                self.group_reads["unchanged"] += 1
+                _LOGGER.debug(f"{setting_type} settings unchanged")
+                return True
+            items = group.items if group else None
+            if not items:
+                _LOGGER.warning(f"No data returned for {setting_type} settings")
+                return False
+
+            self.group_reads["parsed"] += 1
+            if group.hashlist is not None:
+                self._group_hashlists[setting_type] = group.hashlist
+            for name, item in items.items():
+                data[f"{setting_type}_{name}"] = coerce_value(item.value)
+                if item.id is not None:
+                    data[f"{setting_type}_{name}_hash"] = item.id
+            _LOGGER.debug(f"Got {len(items)} {setting_type} settings: {list(items)}")
+            return True
+        except Exception as e:
+            _LOGGER.warning(f"Failed to get {setting_type} settings: {e}")
+            return False
+
+    async def _fetch_setting(self, data: dict, setting_type: str, setting_name: str) -> bool:
+        """Fetch a single setting (value and HASHVAL) into data."""
+        try:
+            item = await self.client.async_get_setting(setting_type, setting_name)
+            if item is None:
+                _LOGGER.warning(f"No data returned for {setting_type} {setting_name}")
+                return False
+
+            data[f"{setting_type}_{setting_name}"] = coerce_value(item.value)
+            data[f"{setting_type}_{setting_name}_hash"] = item.id
+            _LOGGER.debug(f"Got {setting_type} {setting_name}: {item.value}")
+            return True
+        except Exception as e:
+            _LOGGER.warning(f"Failed to get {setting_type} {setting_name}: {e}")
+            return False
+
+    async def _fetch_current_source(self, data: dict) -> bool:
+        """Fetch current input, resolving the app name when on SmartCast."""
+        try:
+            current_input = await self.vizio.get_current_input(log_api_exception=False)
+
+            # If on SmartCast input, get the actual app name
+            if current_input == "SMARTCAST":
+                if self.app_catalog is not None:
+                    config = await self.vizio.get_current_app_config(log_api_exception=False)
+                    current_app = self.app_catalog.resolve(config)
+                else:
+                    current_app = await self.vizio.get_current_app(log_api_exception=False)
+                if current_app and current_app not in (UNKNOWN_APP, NO_APP_RUNNING):
+                    data["current_source"] = current_app
+                    _LOGGER.debug(f"Current source: {current_app} (app)")
+                else:
+                    data["current_source"] = current_input
+                    _LOGGER.debug(f"Current source: {current_input}")
+            elif current_input:
+                data["current_source"] = current_input
+                _LOGGER.debug(f"Current source: {current_input} (input)")
+            return bool(current_input)
+        except Exception as e:
+            _LOGGER.warning(f"Failed to get current input/app: {e}")
+            return False
+
+    async def _fetch_power_state(self, data: dict) -> bool:
+        """Fetch power state."""
+        try:
+            power_state = await self.vizio.get_power_state(log_api_exception=False)
+            data["power_state"] = power_state
+            _LOGGER.debug(f"Power state: {power_state}")
+            return power_state is not None
+        except Exception as e:
+            _LOGGER.warning(f"Failed to get power state: {e}")
+            return False
+
+    async def _fetch_power_mode(self, data: dict) -> bool:
+        """Fetch power mode (Eco Mode vs Quick Start) - needed for power switch."""
+        try:
+            item = await self.vizio.get_setting("system", "power_mode", log_api_exception=False)
+            if item:
+                if hasattr(item, 'value'):
+                    data["power_mode"] = item.value
+                else:
+                    data["power_mode"] = item
+                _LOGGER.debug(f"Power mode: {data.get('power_mode')}")
+                return True
+            return False
+        except Exception as e:
+            _LOGGER.warning(f"Failed to get power mode: {e}")
+            return False
+
+    async def limited(self, fetch: Callable[..., Awaitable[_T]], *args) -> _T:
+        """Run a fetch while holding a slot of the request limit.
+
+        Anything else that sends requests to this TV (e.g. the settings
+        registry's menu walk) goes through here too.
+        """
+        async with self._request_limit, self._global_request_limit:
+            return await fetch(*args)
+
+    def _poll_job(self, name: str, data: dict) -> Awaitable[bool]:
+        """Return the (request limited) fetch for a poll job."""
+        fetch = {
+            "current_source": self._fetch_current_source,
+            "power_state": self._fetch_power_state,
+            "power_mode": self._fetch_power_mode,
+        }.get(name)
+        if fetch is None:
+            # Any other job is a settings group (data holds its last values)
+            return self.limited(self._fetch_group, data, name, True)
+        return self.limited(fetch, data)
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates; the fetch plan follows the listeners."""
+        remove = super().async_add_listener(update_callback, context)
+        self._fetch_plan = None
+
+        @callback
+        def remove_listener() -> None:
+            remove()
+            self._fetch_plan = None
+
+        return remove_listener
+
+    @property
+    def fetch_plan(self) -> list[str]:
+        """Return the poll jobs (besides the power probe) entities need.
+
+        Built from the data keys of the subscribed entities (their
+        coordinator contexts). Disabled entities never subscribe, so a
+        group whose entities are all disabled costs no requests. Rebuilt
+        whenever an entity is added or removed.
+        """
+        if self._fetch_plan is None:
+            keys = set().union(*self.async_contexts())
+            groups = set()
+            for key in keys - {"power_state", "current_source", "power_mode"}:
+                # <group>_<name>, e.g. audio_volume or closed_captions_enabled
+                groups.add((self.setting_keys.get(key) or key.split("_", 1))[0])
+            self._fetch_plan = [
+                name
+                for name in DEFAULT_POLL_INTERVALS
+                if name != "power_state" and (name in keys or name in groups)
+            ] + sorted(groups - set(DEFAULT_POLL_INTERVALS))
+            _LOGGER.debug(f"{self.device_name}: fetch plan {self._fetch_plan}")
+        return self._fetch_plan
+
+    def _due_jobs(self, now: float, force: bool) -> list[str]:
+        """Return the poll jobs whose interval has elapsed (or all if force)."""
+        return [
+            name
+            for name in self.fetch_plan
+            if force
+            or name not in self._last_polled
+            or now - self._last_polled[name]
+            >= self._poll_intervals.get(name, DEFAULT_SETTINGS_GROUP_POLL_INTERVAL)
+            - POLL_INTERVAL_SLACK
+        ]
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch data from Vizio.
+
+        Runs every power_state interval, but each poll job has its own
+        interval (see DEFAULT_POLL_INTERVALS), so rarely changing keys are
+        fetched rarely, and only jobs in the fetch plan (what the enabled
+        entities show) run at all. Keys not due keep their last value. While the TV is
+        off only the power probe (and power_mode, when due) runs.
+
+        A settings group whose HASHLIST hasn't changed since the last read
+        keeps its values without its items being parsed. Keys written
+        (e.g. shown optimistically) while the poll ran keep the new value.
+
+        Due jobs run concurrently (bounded by max_concurrent_requests). Each
+        fetch handles its own errors, so one failing key doesn't affect the
+        others; a failed job is retried on the next cycle.
+
+        If the power probe fails, nothing else is polled that cycle. After
+        failure_threshold failures in a row the TV's entities become
+        unavailable and only the probe runs, with backoff (see
+        poll_interval), until the TV answers again.
+        """
+        # Until the update succeeds, treat it as changing everything (e.g.
+        # availability when it fails)
+        self._changed_keys = None
+        data = dict(self.data or {})
+        generation = self._generation
+        start = time.monotonic()
+        # Everything may have changed while the TV was off or unreachable
+        was_on = bool(data.get("power_state")) and not self.is_unreachable
+
+        power_ok = await self._poll_job("power_state", data)
+        if not power_ok:
+            self._consecutive_failures += 1
+            self.cycle_stats.record((time.monotonic() - start) * 1000, failed=True)
+            if self.is_unreachable:
+                raise UpdateFailed(
+                    f"{self.device_name} unreachable after {self._consecutive_failures} "
+                    f"failed probes, next probe in {self.poll_interval.total_seconds():.0f}s"
+                )
+            # Keep showing the last values until the threshold is reached
+            self._changed_keys = set()
+            return dict(self.data or {})
+
+        if self.is_unreachable:
+            _LOGGER.info(f"{self.device_name}: reachable again, resuming full polling")
+        self._consecutive_failures = 0
+        self._last_polled["power_state"] = start
+
+        if data.get("power_state"):
+            # Everything may have changed while the TV was off
+            due = self._due_jobs(start, force=not was_on)
+        else:
+            due = [name for name in self._due_jobs(start, force=False) if name in OFF_STATE_POLL_JOBS]
+
+        results = await asyncio.gather(*(self._poll_job(name, data) for name in due))
+        for name, ok in zip(due, results):
+            if ok:
+                self._last_polled[name] = start
+        # Keys written while this poll ran: it may have read the old values
+        self._keep_newer_writes(data, generation)
+        # Don't flip back to the old value while the TV is still settling
+        data.update(self._pending)
+
+        self._track_changes(data)
+
+        elapsed = time.monotonic() - start
+        self.cycle_stats.record(elapsed * 1000)
+        _LOGGER.info(
+            f"{self.device_name}: coordinator update complete in {elapsed:.2f}s. "
+            f"Polled: {['power_state', *due]}, changed: {sorted(self._changed_keys)}"
+        )
+        _LOGGER.debug(f"Connection pool: {self.client.connection_stats}")
+        return data
+
+    def _track_changes(self, data: dict[str, Any]) -> None:
+        """Work out which keys data changes compared to the current data."""
+        previous = self.data or {}
+        changed = {key for key, value in data.items() if previous.get(key, object()) != value}
+        changed |= previous.keys() - data.keys()
+        skipped = len(data) - len(changed & data.keys())
+
+        self._changed_keys = changed
+        self.last_cycle_changes = {"changed": len(changed), "skipped": skipped}
+        self.total_changes["changed"] += len(changed)
+        self.total_changes["skipped"] += skipped
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify only the listeners whose keys changed.
+
+        Entities pass a frozenset of the data keys they read as their coordinator
+        context; listeners without a context (e.g. diagnostic sensors) are
+        always notified. When availability changes, everyone is.
+        """
+        changed = self._changed_keys
+        self._changed_keys = None
+        if changed is None or self.last_update_success != self._last_notified_success:
+            self._last_notified_success = self.last_update_success
+            super().async_update_listeners()
+            return
+
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or not changed.isdisjoint(context):
+                update_callback()
+
+    @callback
+    def async_seed(self, data: dict[str, Any]) -> None:
+        """Start from last known data, e.g. saved by the previous run.
+
+        Entities show it until the first poll replaces it. Nothing counts
+        as polled yet, so the first cycle fetches everything.
+        """
+        self.data = dict(data)
+
+    def _forget_hashlist(self, key: str) -> None:
+        """Make the next poll re-parse key's settings group.
+
+        Needed after showing a value the TV hasn't confirmed: if the write
+        failed, the group's HASHLIST is unchanged and the poll would keep it.
+        """
+        if key not in ("current_source", "power_state", "power_mode"):
+            setting_type = (self.setting_keys.get(key) or key.split("_", 1))[0]
+            self._group_hashlists.pop(setting_type, None)
+
+    def _stamp(self, keys: Iterable[str]) -> None:
+        """Note that keys were just written locally (see _keep_newer_writes)."""
+        self._generation += 1
+        for key in keys:
+            self._written[key] = self._generation
+
+    def _keep_newer_writes(self, data: dict[str, Any], generation: int) -> None:
+        """Keep the current values of keys written after generation.
+
+        data was read from the TV starting at generation. For keys written
+        since then (and their HASHVALs) it may hold what the TV had before
+        the write, or a HASHVAL the write used up, so the current data wins.
+        """
+        current = self.data or {}
+        for key, written in self._written.items():
+            if written <= generation:
+                continue
+            for data_key in (key, f"{key}_hash"):
+                if data_key in current:
+                    data[data_key] = current[data_key]
+                else:
+                    data.pop(data_key, None)
+
+    @callback
+    def async_set_optimistic(self, key: str, value: Any) -> None:
+        """Show a commanded value right away, before the TV confirms it."""
+        self._stamp([key])
+        self._forget_hashlist(key)
+        self._changed_keys = {key}
+        self.data = {**(self.data or {}), key: value}
+        self.async_update_listeners()
+
+    async def async_apply_settings(self, settings: dict[str, dict[str, Any]]) -> dict[str, str]:
+        """Write many settings in one batch, e.g. a picture preset.
+
+        settings maps group to {name: value}, e.g. {"picture": {"backlight": 40}}.
+        Writes go out concurrently (bounded by the request limits) over the
+        keep-alive pool, using the cached HASHVALs. Groups with a setting
+        that has no cached HASHVAL are read first, one request per group.
+        Afterwards each affected group is re-read once.
+
+        Returns {"<group>_<name>": reason} for every setting that failed.
+        """
+        data = self.data if self.data is not None else {}
+        writes = [
+            (setting_type, setting_name, value)
+            for setting_type, values in settings.items()
+            for setting_name, value in values.items()
+        ]
+
+        # Show the new values right away
+        self._stamp(f"{t}_{n}" for t, n, _ in writes)
+        self._changed_keys = {f"{t}_{n}" for t, n, _ in writes}
+        self.data = data = {**data, **{f"{t}_{n}": v for t, n, v in writes}}
+        self.async_update_listeners()
+
+        missing_hash = {t for t, n, _ in writes if f"{t}_{n}_hash" not in data}
+        await asyncio.gather(*(self.limited(self._fetch_group, data, t) for t in missing_hash))
+        # The group read also returned the current values; keep showing the new ones
+        data.update({f"{t}_{n}": v for t, n, v in writes})
+        for setting_type in settings:
+            self._group_hashlists.pop(setting_type, None)
+
+        async def write(setting_type: str, setting_name: str, value: Any) -> bool:
+            try:
+                return await self.client.async_set_setting(setting_type, setting_name, value, data)
+            except Exception as e:
+                _LOGGER.warning(f"Failed to set {setting_type}.{setting_name}: {e}")
+                return False
+
+        results = await asyncio.gather(*(self.limited(write, *w) for w in writes))
+        failed = {
+            f"{t}_{n}": f"TV rejected {t}.{n} = {v}"
+            for (t, n, v), ok in zip(writes, results)
+            if not ok
+        }
+
+        # One read per group confirms the written values (or reverts failed ones)
+        refreshed: dict[str, Any] = {}
+        generation = self._generation
+        await asyncio.gather(*(self.limited(self._fetch_group, refreshed, t) for t in settings))
+        self._async_merge(refreshed, generation)
+        return failed
+
+    async def _fetch_key(self, key: str) -> dict[str, Any]:
+        """Fetch a single data key (and its HASHVAL, for settings)."""
+        data: dict[str, Any] = {}
+        if key in ("current_source", "power_state", "power_mode"):
+            await self._poll_job(key, data)
+        else:
+            # <group>_<name>, e.g. audio_mute or closed_captions_enabled
+            setting_type, setting_name = self.setting_keys.get(key) or key.split("_", 1)
+            await self.limited(self._fetch_setting, data, setting_type, setting_name)
+        return data
+
+    @callback
+    def _async_merge(self, data: dict[str, Any], generation: int) -> None:
+        """Merge keys fetched since generation into the current data and notify."""
+        self._keep_newer_writes(data, generation)
+        if data:
+            data = {**(self.data or {}), **data}
+            self._track_changes(data)
+            self.data = data
+            self.async_update_listeners()
+
+    async def async_refresh_key(self, key: str) -> None:
+        """Re-fetch a single data key and merge it into the current data.
+
+        Used after commands instead of a full refresh. Doesn't touch the
+        polling schedule.
+        """
+        generation = self._generation
+        self._async_merge(await self._fetch_key(key), generation)
+
+    async def async_confirm_key(self, key: str, expected: Any) -> bool:
+        """Re-fetch a key in a short burst until the TV reports expected.
+
+        For commands the TV takes a few seconds to act on (power, input,
+        app launch), where a single re-read usually still sees the old
+        value. The key is fetched every CONFIRM_POLL_INTERVAL seconds for
+        up to CONFIRM_POLL_DURATION. Until then the commanded value keeps
+        showing (polls included); after that, whatever the TV last
+        reported. The regular schedule isn't touched.
+
+        Returns True if the TV reported expected.
+        """
+        self._pending[key] = expected
+        deadline = time.monotonic() + CONFIRM_POLL_DURATION
+        try:
+            while True:
+                generation = self._generation
+                data = await self._fetch_key(key)
+                confirmed = key in data and data[key] == expected
+                if confirmed or time.monotonic() + CONFIRM_POLL_INTERVAL > deadline:
+                    break
+                await asyncio.sleep(CONFIRM_POLL_INTERVAL)
+        finally:
+            if self._pending.get(key) == expected:
+                del self._pending[key]
+        if key in self._pending:
+            # A newer command for key is being confirmed
+            return confirmed
+        if not confirmed:
+            _LOGGER.debug(
+                f"{self.device_name}: {key} still {data.get(key)!r}, not {expected!r}, "
+                f"after {CONFIRM_POLL_DURATION}s"
+            )
+        self._async_merge(data, generation)
+        return confirmed
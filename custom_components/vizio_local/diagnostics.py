@@ -0,0 +1,47 @@
+"""Diagnostics (request and poll statistics) for Vizio Local Control."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+
+from .const import DOMAIN
+
+
+def async_get_device_diagnostics(device: dict[str, Any]) -> dict[str, Any]:
+    """Return diagnostics for one TV."""
+    coordinator = device["coordinator"]
+    client = device["client"]
+    return {
+        "name": coordinator.device_name,
+        "host": client.ip,
+        "last_update_success": coordinator.last_update_success,
+        "data_keys": sorted(coordinator.data or {}),
+        "fetch_plan": ["power_state", *coordinator.fetch_plan],
+        "poll_cycles": coordinator.cycle_stats.as_dict(),
+        "group_reads": coordinator.group_reads,
+        "key_changes": {
+            "last_update": coordinator.last_cycle_changes,
+            "total": coordinator.total_changes,
+        },
+        "requests": client.request_stats.as_dict(),
+        "endpoints": {
+            endpoint: stats.as_dict()
+            for endpoint, stats in sorted(client.endpoint_stats.items())
+        },
+        "connections": client.connection_stats,
+        "capture": client.capture.path if client.capture else None,
+    }
+
+
+async def async_handle_get_diagnostics(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """Return diagnostics for every configured TV (vizio_local.get_diagnostics)."""
+    devices = hass.data[DOMAIN]["devices"]
+    return {
+        "devices": {
+            device_id: async_get_device_diagnostics(device)
+            for device_id, device in devices.items()
+        }
+    }
@@ -0,0 +1,83 @@
+"""On-disk cache of each TV's last known coordinator data."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .coordinator import VizioLocalCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.last_state"
+
+# Seconds to batch writes to disk, counted from the first change since the
+# last write (later changes don't push it back). Pending writes are flushed
+# when Home Assistant stops.
+SAVE_DELAY = 30
+
+
+class LastStateCache:
+    """Last known data for all TVs, stored in Home Assistant's .storage.
+
+    Used to show entities with their last values right away at startup,
+    while the first poll runs in the background. HASHVALs are left out:
+    they are only good for one write and are re-read by the first poll.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize cache."""
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._devices: dict[str, dict[str, Any]] = {}
+        self._save_scheduled = False
+
+    async def async_load(self) -> None:
+        """Load last known data from disk."""
+        data = await self._store.async_load()
+        if data:
+            self._devices = data.get("devices", {})
+        _LOGGER.debug(f"Loaded last known state for {list(self._devices)}")
+
+    def get(self, device_key: str) -> dict[str, Any] | None:
+        """Return a TV's last known data, or None if not cached."""
+        return self._devices.get(device_key)
+
+    @callback
+    def async_track(self, coordinator: VizioLocalCoordinator) -> CALLBACK_TYPE:
+        """Seed a coordinator with its TV's last known data, then keep it saved.
+
+        A TV seen for the first time starts out empty, so its entities are
+        unknown (rather than unavailable) until the first poll.
+        """
+        device_key = coordinator.unique_id_prefix
+        coordinator.async_seed(self.get(device_key) or {})
+
+        @callback
+        def async_save() -> None:
+            # Notified on every poll; most change nothing worth saving
+            if coordinator.data:
+                self.async_set(device_key, coordinator.data)
+
+        return coordinator.async_add_listener(async_save)
+
+    @callback
+    def async_set(self, device_key: str, data: dict[str, Any]) -> None:
+        """Store a TV's data and schedule a save to disk, if it changed."""
+        data = {key: value for key, value in data.items() if not key.endswith("_hash")}
+        if self._devices.get(device_key) == data:
+            return
+        self._devices[device_key] = data
+        if not self._save_scheduled:
+            # Rescheduling would push the write back on every change
+            self._save_scheduled = True
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to write (called by the store when it writes)."""
+        self._save_scheduled = False
+        return {"devices": self._devices}
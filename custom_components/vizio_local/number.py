@@ -2,71 +2,55 @@
 from __future__ import annotations
 
 import logging
+from functools import partial
 
 from homeassistant.components.number import NumberEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import DOMAIN
+from .registry import DEFAULT_ENABLED_SETTINGS
+from .writer import CoalescingWriter
 
 _LOGGER = logging.getLogger(__name__)
 
-PICTURE_SETTINGS = {
-    "backlight": {"min": 0, "max": 100, "step": 1},
-    "brightness": {"min": 0, "max": 100, "step": 1},
-    "contrast": {"min": 0, "max": 100, "step": 1},
-    "color": {"min": 0, "max": 100, "step": 1},
-    "tint": {"min": 0, "max": 100, "step": 1},
-    "sharpness": {"min": 0, "max": 100, "step": 1},
-}
-
-AUDIO_SETTINGS = {
-    "volume": {"min": 0, "max": 100, "step": 1},
-}
-
 async def async_setup_platform(
     hass: HomeAssistant,
     config: ConfigType,
     async_add_entities: AddEntitiesCallback,
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
-    """Set up number entities."""
-    coordinator = hass.data[DOMAIN]["coordinator"]
-    vizio = hass.data[DOMAIN]["vizio"]
-
-    entities = []
-
-    # Picture settings
-    for setting_name, config in PICTURE_SETTINGS.items():
-        entities.append(
-            VizioNumberEntity(
-                coordinator,
-                vizio,
-                setting_name,
-                "picture",
-                config["min"],
-                config["max"],
-                config["step"],
-            )
-        )
-
-    # Audio settings
-    for setting_name, config in AUDIO_SETTINGS.items():
-        entities.append(
+    """Set up number entities for the TV's slider settings."""
+    if discovery_info is None:
+        return
+
+    device = hass.data[DOMAIN]["devices"][discovery_info["device_id"]]
+    coordinator = device["coordinator"]
+    client = device["client"]
+    registry = device["settings"]
+
+    @callback
+    def async_add_settings(settings: dict[str, dict]) -> None:
+        """Add an entity per slider setting."""
+        async_add_entities(
             VizioNumberEntity(
                 coordinator,
-                vizio,
-                setting_name,
-                "audio",
-                config["min"],
-                config["max"],
-                config["step"],
+                client,
+                entry["name"],
+                entry["group"],
+                entry["min"],
+                entry["max"],
+                entry["step"],
+                enabled_default=key in DEFAULT_ENABLED_SETTINGS,
             )
+            for key, entry in settings.items()
         )
 
-    async_add_entities(entities)
+    async_add_settings(registry.entries("number"))
+    # Settings found once the TV's menu has been read
+    registry.async_add_listener("number", async_add_settings)
 
 class VizioNumberEntity(CoordinatorEntity, NumberEntity):
     """Vizio number entity."""
@@ -74,52 +58,78 @@ class VizioNumberEntity(CoordinatorEntity, NumberEntity):
     def __init__(
         self,
         coordinator,
-        vizio,
+        client,
         setting_name: str,
         setting_type: str,
         min_value: float,
         max_value: float,
         step: float,
+        enabled_default: bool = True,
     ) -> None:
         """Initialize number entity."""
-        super().__init__(coordinator)
-        self._vizio = vizio
+        # Only updated when this setting changes
+        super().__init__(coordinator, context=frozenset({f"{setting_type}_{setting_name}"}))
+        self._client = client
         self._setting_name = setting_name
         self._setting_type = setting_type
         self._attr_native_min_value = min_value
         self._attr_native_max_value = max_value
         self._attr_native_step = step
-        self._attr_name = f"Vizio {setting_name.replace('_', ' ').title()}"
-        self._attr_unique_id = f"vizio_{setting_type}_{setting_name}"
+        self._attr_entity_registry_enabled_default = enabled_default
+        self._attr_name = f"{coordinator.device_name} {setting_name.replace('_', ' ').title()}"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_{setting_type}_{setting_name}"
+        self._key = f"{setting_type}_{setting_name}"
+        self._writer: CoalescingWriter | None = None
 
     @property
     def native_value(self) -> float | None:
         """Return current value."""
-        key = f"{self._setting_type}_{self._setting_name}"
-        value = self.coordinator.data.get(key)
+        value = self.coordinator.data.get(self._key)
         if value is not None:
             if isinstance(value, str):
                 return 0 if value == "Off" else 1
             return float(value)
         return None
 
+    async def async_added_to_hass(self) -> None:
+        """Set up the write scheduler when added to hass."""
+        await super().async_added_to_hass()
+        self._writer = CoalescingWriter(
+            self.hass,
+            f"{self._setting_type}.{self._setting_name}",
+            self._async_write_value,
+            partial(self.coordinator.async_refresh_key, self._key),
+        )
+
     async def async_set_native_value(self, value: float) -> None:
-        """Set new value."""
-        _LOGGER.info(f"Setting {self._setting_type}.{self._setting_name} to {int(value)}")
+        """Set new value.
+
+        The new value is shown right away. Slider drags send bursts of
+        values; the writer only sends the latest one and re-reads this
+        setting once the burst is done.
+        """
+        self.coordinator.async_set_optimistic(self._key, int(value))
+        await self._writer.async_write(int(value))
+
+    async def _async_write_value(self, value: int) -> bool:
+        """Write value to the TV."""
+        _LOGGER.info(f"Setting {self._setting_type}.{self._setting_name} to {value}")
 
         try:
-            result = await self._vizio.set_setting(
+            result = await self._client.async_set_setting(
                 self._setting_type,
                 self._setting_name,
-                int(value),
-                log_api_exception=False,
+                value,
+                self.coordinator.data,
             )
 
             if result:
                 _LOGGER.info(f"Successfully set {self._setting_name} to {value}")
-                await self.coordinator.async_request_refresh()
-            else:
-                _LOGGER.error(f"set_setting returned False for {self._setting_name}")
+                return True
+
+            _LOGGER.error(f"async_set_setting returned False for {self._setting_name}")
+            return False
 
         except Exception as e:
             _LOGGER.error(f"Exception setting {self._setting_name}: {e}", exc_info=True)
+            return False
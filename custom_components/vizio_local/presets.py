@@ -0,0 +1,110 @@
+"""The apply_picture_preset service: write many settings in one batch."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+ATTR_DEVICE = "device"
+ATTR_PRESET = "preset"
+ATTR_SETTINGS = "settings"
+
+
+def _setting_value(value: Any) -> int | str:
+    """Validate a setting value: a whole number (sliders) or a string (lists).
+
+    Booleans are rejected rather than sent as 1/0 or "True": YAML reads an
+    unquoted On/Off as a boolean, so list options like that must be quoted.
+    Fractions are rejected rather than rounded.
+    """
+    if isinstance(value, bool):
+        raise vol.Invalid(f"expected a number or a string, got {value} (quote On/Off values)")
+    if isinstance(value, float):
+        if not value.is_integer():
+            raise vol.Invalid(f"expected a whole number, got {value}")
+        return int(value)
+    if isinstance(value, (int, str)):
+        return value
+    raise vol.Invalid(f"expected a number or a string, got {value!r}")
+
+
+# {group: {setting name: value}}, e.g. {"picture": {"backlight": 40}}
+SETTINGS_SCHEMA = vol.Schema({cv.string: {cv.string: _setting_value}})
+
+APPLY_PICTURE_PRESET_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_DEVICE): vol.All(cv.ensure_list, [cv.string]),
+            vol.Exclusive(ATTR_PRESET, "preset"): cv.string,
+            vol.Exclusive(ATTR_SETTINGS, "preset"): SETTINGS_SCHEMA,
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_PRESET, ATTR_SETTINGS),
+)
+
+
+
+def validate_presets(presets: Any) -> dict[str, dict[str, dict[str, Any]]]:
+    """Return the configured presets that are valid settings maps.
+
+    Invalid presets are logged and left out, so applying one fails as an
+    unknown preset instead of sending malformed settings to the TVs.
+    """
+    if not isinstance(presets, dict):
+        _LOGGER.error(f"Ignoring Vizio presets: expected a map of presets, got {presets!r}")
+        return {}
+    valid = {}
+    for name, settings in presets.items():
+        try:
+            valid[str(name)] = SETTINGS_SCHEMA(settings)
+        except vol.Invalid as e:
+            _LOGGER.error(f"Ignoring Vizio preset {name}: {e}")
+    return valid
+
+
+async def async_handle_apply_picture_preset(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """Apply a named preset, or a map of settings, to one or more TVs.
+
+    Each TV gets the whole batch at once (see
+    VizioLocalCoordinator.async_apply_settings); TVs are handled in
+    parallel. Returns the settings that failed per TV.
+    """
+    domain_data = hass.data[DOMAIN]
+    devices = domain_data["devices"]
+
+    if ATTR_PRESET in call.data:
+        preset = call.data[ATTR_PRESET]
+        if preset not in domain_data["presets"]:
+            raise HomeAssistantError(f"Unknown Vizio preset: {preset}")
+        settings = domain_data["presets"][preset]
+    else:
+        settings = call.data[ATTR_SETTINGS]
+
+    device_ids = call.data.get(ATTR_DEVICE, list(devices))
+    unknown = [device_id for device_id in device_ids if device_id not in devices]
+    if unknown:
+        raise HomeAssistantError(f"Unknown Vizio device(s): {', '.join(unknown)}")
+
+    async def apply(device_id: str) -> dict[str, Any]:
+        coordinator = devices[device_id]["coordinator"]
+        if coordinator.is_unreachable:
+            return {"failed": {"*": f"{coordinator.device_name} is unreachable"}}
+        failed = await coordinator.async_apply_settings(settings)
+        if failed:
+            _LOGGER.warning(f"{coordinator.device_name}: preset settings failed: {failed}")
+        return {"failed": failed}
+
+    results = await asyncio.gather(*(apply(device_id) for device_id in device_ids))
+    return {"devices": dict(zip(device_ids, results))}
@@ -0,0 +1,246 @@
+"""Registry of a TV's settings, discovered from its settings menu and cached on disk."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from pyvizio.api._protocol import TYPE_LIST, TYPE_SLIDER, TYPE_X_LIST
+from pyvizio.api.item import Item
+
+from .client import VizioLocalClient
+from .const import DOMAIN, SETTINGS_SCHEMA_TTL
+from .coordinator import VizioLocalCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.settings"
+
+# Seconds to batch writes to disk
+SAVE_DELAY = 10
+
+# Settings groups that aren't turned into entities: inputs are handled by
+# the source select, the rest is network/privacy/admin
+SKIPPED_SETTING_GROUPS = {"devices", "network", "mobile_devices", "admin_and_privacy"}
+
+# Settings that already have a dedicated entity
+SKIPPED_SETTINGS = {"audio_mute"}
+
+# Settings whose entities are enabled by default; everything else the TV
+# reports is created disabled
+DEFAULT_ENABLED_SETTINGS = {
+    "picture_backlight",
+    "picture_brightness",
+    "picture_contrast",
+    "picture_color",
+    "picture_tint",
+    "picture_sharpness",
+    "audio_volume",
+}
+
+# Used until the TV's own menu has been read (e.g. first start with the TV off)
+FALLBACK_SCHEMA = {
+    key: {
+        "group": key.split("_", 1)[0],
+        "name": key.split("_", 1)[1],
+        "platform": "number",
+        "min": 0,
+        "max": 100,
+        "step": 1,
+    }
+    for key in sorted(DEFAULT_ENABLED_SETTINGS)
+}
+
+
+def schema_entry(group: str, item: Item) -> dict[str, Any] | None:
+    """Return the schema entry for a settings item, or None if it gets no entity.
+
+    Sliders become numbers, On/Off lists switches and other lists (plain
+    or X lists) selects. Plain values (mostly read-only info) are skipped.
+    """
+    entry: dict[str, Any] = {"group": group, "name": item.c_name}
+    item_type = (item.type or "").lower()
+    if item_type == TYPE_SLIDER:
+        entry.update(
+            platform="number",
+            min=item.min if item.min is not None else 0,
+            max=item.max if item.max is not None else 100,
+            step=1,
+        )
+    elif item_type in (TYPE_LIST, TYPE_X_LIST) and item.choices:
+        options = [str(choice) for choice in item.choices]
+        platform = "switch" if sorted(options) == ["Off", "On"] else "select"
+        entry.update(platform=platform, options=options)
+    else:
+        return None
+    return entry
+
+
+class SettingsSchemaCache:
+    """Settings schemas for all TVs, stored in Home Assistant's .storage."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize cache."""
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._devices: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load cached schemas from disk."""
+        data = await self._store.async_load()
+        if data:
+            self._devices = data.get("devices", {})
+        _LOGGER.debug(f"Loaded cached settings schemas for {list(self._devices)}")
+
+    def get(self, device_key: str) -> dict[str, dict[str, Any]] | None:
+        """Return a TV's cached schema, or None if not cached."""
+        entry = self._devices.get(device_key)
+        return entry["settings"] if entry else None
+
+    def is_fresh(self, device_key: str) -> bool:
+        """Return True if the TV's schema is younger than SETTINGS_SCHEMA_TTL."""
+        entry = self._devices.get(device_key)
+        if entry is None:
+            return False
+        updated = dt_util.parse_datetime(entry["updated"])
+        return updated is not None and dt_util.utcnow() - updated < SETTINGS_SCHEMA_TTL
+
+    @callback
+    def async_set(self, device_key: str, settings: dict[str, dict[str, Any]]) -> None:
+        """Store a TV's schema and schedule a save to disk."""
+        self._devices[device_key] = {
+            "settings": settings,
+            "updated": dt_util.utcnow().isoformat(),
+        }
+        self._store.async_delay_save(lambda: {"devices": self._devices}, SAVE_DELAY)
+
+
+class SettingsRegistry:
+    """One TV's settings: what they are, and which entity platform each gets.
+
+    The schema (type, range, options of every setting) comes from walking
+    the TV's settings menu once: one request for the list of groups and
+    one per group. It's cached on disk and re-read in the background when
+    older than SETTINGS_SCHEMA_TTL. Settings menus are mostly empty while
+    the TV is off, so a walk that finds nothing is retried the next time
+    the TV is on. Entity platforms subscribe to add entities for settings
+    discovered after they were set up.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: VizioLocalCoordinator,
+        client: VizioLocalClient,
+        cache: SettingsSchemaCache,
+    ) -> None:
+        """Initialize registry."""
+        self._hass = hass
+        self._coordinator = coordinator
+        self._client = client
+        self._cache = cache
+        self._device_key = coordinator.unique_id_prefix
+        self._listeners: list[Callable[[dict[str, dict[str, Any]]], None]] = []
+        self._unsub_coordinator: CALLBACK_TYPE | None = None
+        self._discover_task: asyncio.Task | None = None
+
+        self.schema: dict[str, dict[str, Any]] = dict(
+            cache.get(self._device_key) or FALLBACK_SCHEMA
+        )
+        self._async_update_coordinator()
+
+    @callback
+    def async_start(self) -> None:
+        """Re-read the schema in the background if it's missing or stale."""
+        if self._cache.is_fresh(self._device_key):
+            return
+        self._async_start_discover()
+        # Retried on updates until a walk succeeds (e.g. once the TV is on)
+        self._unsub_coordinator = self._coordinator.async_add_listener(self._async_start_discover)
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop waiting for the TV to be on."""
+        if self._unsub_coordinator is not None:
+            self._unsub_coordinator()
+            self._unsub_coordinator = None
+
+    @callback
+    def async_add_listener(
+        self, platform: str, add: Callable[[dict[str, dict[str, Any]]], None]
+    ) -> None:
+        """Call add with newly discovered settings for platform."""
+        self._listeners.append(
+            lambda new: add({k: e for k, e in new.items() if e["platform"] == platform})
+        )
+
+    def entries(self, platform: str) -> dict[str, dict[str, Any]]:
+        """Return the settings that get an entity of platform."""
+        return {key: entry for key, entry in self.schema.items() if entry["platform"] == platform}
+
+    @callback
+    def _async_start_discover(self) -> None:
+        """Walk the settings menu, unless the TV is off or a walk is running."""
+        if not self._coordinator.data or not self._coordinator.data.get("power_state"):
+            return
+        if self._discover_task is not None and not self._discover_task.done():
+            return
+        self._discover_task = self._hass.async_create_background_task(
+            self._async_discover(), f"{DOMAIN} settings discovery {self._coordinator.device_name}"
+        )
+
+    async def _async_discover(self) -> None:
+        """Read the TV's settings menu and add any new settings."""
+        schema = await self._async_walk()
+        if not schema:
+            _LOGGER.debug(f"{self._coordinator.device_name}: no settings found, will retry")
+            return
+        self.async_stop()
+
+        new = {key: entry for key, entry in schema.items() if key not in self.schema}
+        self.schema.update(schema)
+        self._cache.async_set(self._device_key, self.schema)
+        self._async_update_coordinator()
+        _LOGGER.info(
+            f"{self._coordinator.device_name}: found {len(schema)} settings, {len(new)} new"
+        )
+        if new:
+            for listener in self._listeners:
+                listener(new)
+
+    async def _async_walk(self) -> dict[str, dict[str, Any]]:
+        """Return the schema of every settings group the TV reports."""
+        try:
+            # Within the TV's request limit, alongside polls and commands
+            limited = self._coordinator.limited
+            groups = await limited(self._client.async_get_settings_menus)
+            if not groups:
+                return {}
+            groups = [group for group in groups if group not in SKIPPED_SETTING_GROUPS]
+            results = await asyncio.gather(
+                *(limited(self._client.async_get_settings_group, group) for group in groups)
+            )
+        except Exception as e:
+            _LOGGER.warning(f"Failed to read settings menu: {e}")
+            return {}
+
+        schema = {}
+        for group, result in zip(groups, results):
+            items = result.items if result else None
+            for name, item in (items or {}).items():
+                key = f"{group}_{name}"
+                entry = schema_entry(group, item)
+                if entry is not None and key not in SKIPPED_SETTINGS:
+                    schema[key] = entry
+        return schema
+
+    @callback
+    def _async_update_coordinator(self) -> None:
+        """Tell the coordinator which group and name each setting key is."""
+        self._coordinator.setting_keys.update(
+            {key: (entry["group"], entry["name"]) for key, entry in self.schema.items()}
+        )
@@ -0,0 +1,171 @@
+"""Remote entity for Vizio TV key presses."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components.remote import (
+    ATTR_DELAY_SECS,
+    ATTR_NUM_REPEATS,
+    RemoteEntity,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_platform
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from pyvizio.api._protocol import KEY_CODE
+
+from . import DOMAIN
+from .const import SERVICE_SEND_KEYS
+
+_LOGGER = logging.getLogger(__name__)
+
+ATTR_KEYS = "keys"
+ATTR_KEY = "key"
+ATTR_REPEAT = "repeat"
+ATTR_DELAY = "delay"
+
+KEY_NAME = vol.All(cv.string, vol.Upper, vol.In(list(KEY_CODE["tv"])))
+
+# A step is a key name, {key: NAME, repeat: N} or a pause {delay: seconds}
+KEY_STEP = vol.Any(
+    KEY_NAME,
+    {vol.Required(ATTR_KEY): KEY_NAME, vol.Optional(ATTR_REPEAT, default=1): cv.positive_int},
+    {vol.Required(ATTR_DELAY): cv.positive_float},
+)
+
+SEND_KEYS_SCHEMA = {
+    vol.Required(ATTR_KEYS): vol.All(cv.ensure_list, [KEY_STEP]),
+    vol.Optional(ATTR_REPEAT, default=1): cv.positive_int,
+    vol.Optional(ATTR_DELAY, default=0): cv.positive_float,
+}
+
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up remote entity."""
+    if discovery_info is None:
+        return
+
+    device = hass.data[DOMAIN]["devices"][discovery_info["device_id"]]
+    coordinator = device["coordinator"]
+    client = device["client"]
+
+    async_add_entities([VizioRemote(coordinator, client)])
+
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        SERVICE_SEND_KEYS, SEND_KEYS_SCHEMA, "async_send_keys"
+    )
+
+class VizioRemote(CoordinatorEntity, RemoteEntity):
+    """Vizio remote - sends key presses (navigation, volume, playback...).
+
+    Consecutive key presses are sent together in one KEYLIST request (see
+    VizioLocalClient.async_send_keys); only delays split a sequence.
+    """
+
+    def __init__(self, coordinator, client) -> None:
+        """Initialize remote entity."""
+        super().__init__(coordinator, context=frozenset({"power_state"}))
+        self._client = client
+        self._attr_name = f"{coordinator.device_name} Remote"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_remote"
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return True if TV is on."""
+        power_state = self.coordinator.data.get("power_state")
+        if power_state is not None:
+            return bool(power_state)
+        return None
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Turn on TV."""
+        await self._async_press_power("POW_ON", True)
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Turn off TV."""
+        await self._async_press_power("POW_OFF", False)
+
+    async def _async_press_power(self, key: str, power_state: bool) -> None:
+        """Press a power key, showing the new state right away."""
+        self.coordinator.async_set_optimistic("power_state", power_state)
+        if await self._client.async_send_keys([key]):
+            await self.coordinator.async_confirm_key("power_state", power_state)
+        else:
+            await self.coordinator.async_refresh_key("power_state")
+
+    async def async_send_command(self, command: Iterable[str], **kwargs: Any) -> None:
+        """Send keys (remote.send_command).
+
+        The whole command list is one batch, repeated num_repeats times
+        with delay_secs between repeats.
+        """
+        try:
+            keys = [KEY_NAME(key) for key in command]
+        except vol.Invalid as e:
+            raise HomeAssistantError(f"Unknown Vizio key: {e}") from e
+        await self.async_send_keys(
+            keys,
+            repeat=kwargs.get(ATTR_NUM_REPEATS, 1),
+            between_repeats=kwargs.get(ATTR_DELAY_SECS, 0),
+        )
+
+    async def async_send_keys(
+        self,
+        keys: list[str | dict[str, Any]],
+        repeat: int = 1,
+        delay: float = 0,
+        between_repeats: float = 0,
+    ) -> None:
+        """Send a key sequence (vizio_local.send_keys).
+
+        keys are validated steps (see KEY_STEP). delay is a pause after
+        every key press, which means one request per key; without it,
+        presses between explicit {delay: ...} steps go out as one batch.
+        """
+        steps: list[str | float] = []
+        for index in range(repeat):
+            if index and between_repeats:
+                steps.append(between_repeats)
+            for step in keys:
+                if isinstance(step, dict) and ATTR_DELAY in step:
+                    steps.append(step[ATTR_DELAY])
+                    continue
+                key, count = (step[ATTR_KEY], step[ATTR_REPEAT]) if isinstance(step, dict) else (step, 1)
+                for _ in range(count):
+                    steps.append(key)
+                    if delay:
+                        steps.append(delay)
+        # No point waiting after the last key
+        while steps and not isinstance(steps[-1], str):
+            steps.pop()
+
+        batch: list[str] = []
+        for step in steps:
+            if isinstance(step, str):
+                batch.append(step)
+                continue
+            await self._async_send_batch(batch)
+            batch = []
+            await asyncio.sleep(step)
+        await self._async_send_batch(batch)
+
+    async def _async_send_batch(self, keys: list[str]) -> None:
+        """Send consecutive key presses."""
+        if not keys:
+            return
+        _LOGGER.debug(f"Sending keys: {keys}")
+        if not await self._client.async_send_keys(keys):
+            raise HomeAssistantError(f"Failed to send keys to {self.coordinator.device_name}")
@@ -0,0 +1,118 @@
+"""Shared poll scheduler for all configured TVs."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from functools import partial
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_at
+
+from .const import DOMAIN
+from .coordinator import VizioLocalCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PollScheduler:
+    """Runs every TV's poll cycle, spread evenly across the poll interval.
+
+    Instead of each coordinator scheduling itself (and all of them firing
+    at once), TV n of N is polled at offset n/N of its interval. Each TV's
+    slots are anchored to a fixed start time so they don't drift together
+    as cycle durations vary. If a cycle changes a TV's poll interval
+    (backoff while it's unreachable, or recovery) its slots are re-anchored
+    right away. The scheduler also owns the request limit shared by all TVs.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_concurrent: int) -> None:
+        """Initialize scheduler."""
+        self._hass = hass
+        self._coordinators: list[VizioLocalCoordinator] = []
+        self._unsub: dict[VizioLocalCoordinator, CALLBACK_TYPE] = {}
+        self._refreshing: set[VizioLocalCoordinator] = set()
+        # Caps requests in flight across all TVs
+        self.request_limit = asyncio.Semaphore(max_concurrent)
+
+    @callback
+    def async_add(self, coordinator: VizioLocalCoordinator) -> None:
+        """Add a TV's coordinator. Call before async_start."""
+        self._coordinators.append(coordinator)
+
+    @callback
+    def async_start(self) -> None:
+        """Schedule every TV's slots, starting with its first poll.
+
+        The first TV is polled right away and the others at their offset,
+        so startup doesn't send every TV's first (full) poll at once. The
+        polls run in the background, so they don't hold up Home
+        Assistant's startup even if a TV is slow or unreachable.
+        """
+        now = self._hass.loop.time()
+        count = len(self._coordinators)
+        for index, coordinator in enumerate(self._coordinators):
+            interval = coordinator.poll_interval
+            self._async_schedule(coordinator, now + interval.total_seconds() * index / count)
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel all scheduled polls."""
+        for unsub in self._unsub.values():
+            unsub()
+        self._unsub.clear()
+
+    @callback
+    def _async_schedule(self, coordinator: VizioLocalCoordinator, when: float) -> None:
+        """Schedule coordinator's next poll at loop time when."""
+        self._unsub[coordinator] = async_call_at(
+            self._hass, partial(self._async_poll, coordinator, when), when
+        )
+
+    @callback
+    def _async_poll(
+        self, coordinator: VizioLocalCoordinator, scheduled: float, _now: datetime
+    ) -> None:
+        """Start a poll cycle and schedule the next slot."""
+        interval = coordinator.poll_interval
+        self._async_schedule_next(coordinator, scheduled)
+
+        if coordinator in self._refreshing:
+            _LOGGER.debug(f"{coordinator.device_name}: previous poll still running, skipping slot")
+            return
+        self._async_start_refresh(coordinator, scheduled, interval)
+
+    @callback
+    def _async_start_refresh(
+        self, coordinator: VizioLocalCoordinator, scheduled: float, interval: timedelta
+    ) -> None:
+        """Run a poll cycle as a background task."""
+        self._refreshing.add(coordinator)
+        self._hass.async_create_background_task(
+            self._async_refresh(coordinator, scheduled, interval),
+            f"{DOMAIN} poll {coordinator.device_name}",
+        )
+
+    @callback
+    def _async_schedule_next(self, coordinator: VizioLocalCoordinator, scheduled: float) -> None:
+        """Schedule the slot after scheduled, skipping any we're already late for."""
+        # Stay on this TV's slot grid
+        interval = coordinator.poll_interval.total_seconds()
+        next_slot = scheduled + interval
+        while next_slot <= self._hass.loop.time():
+            next_slot += interval
+        self._async_schedule(coordinator, next_slot)
+
+    async def _async_refresh(
+        self, coordinator: VizioLocalCoordinator, scheduled: float, interval: timedelta
+    ) -> None:
+        """Run a poll cycle, tracking that it's in progress."""
+        try:
+            await coordinator.async_refresh()
+        finally:
+            self._refreshing.discard(coordinator)
+
+        if coordinator.poll_interval != interval and coordinator in self._unsub:
+            # The cycle changed the interval, so the slot booked above is wrong
+            self._unsub.pop(coordinator)()
+            self._async_schedule_next(coordinator, scheduled)
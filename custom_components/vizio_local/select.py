@@ -1,15 +1,19 @@
-"""Select entity for Vizio TV source."""
+"""Select entities for Vizio TV (source and list settings)."""
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from homeassistant.components.select import SelectEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import DOMAIN
+from .apps import AppCatalog
+from .registry import DEFAULT_ENABLED_SETTINGS
+from .sources import SourceListCache
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,46 +23,128 @@ async def async_setup_platform(
     async_add_entities: AddEntitiesCallback,
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
-    """Set up select entity."""
-    coordinator = hass.data[DOMAIN]["coordinator"]
-    vizio = hass.data[DOMAIN]["vizio"]
+    """Set up select entities."""
+    if discovery_info is None:
+        return
 
-    async_add_entities([VizioSourceSelect(coordinator, vizio)])
+    device = hass.data[DOMAIN]["devices"][discovery_info["device_id"]]
+    coordinator = device["coordinator"]
+    client = device["client"]
+    vizio = device["vizio"]
+    registry = device["settings"]
+    source_cache = hass.data[DOMAIN]["source_cache"]
+    app_catalog = hass.data[DOMAIN]["apps"]
+
+    async_add_entities([VizioSourceSelect(coordinator, vizio, source_cache, app_catalog)])
+
+    @callback
+    def async_add_settings(settings: dict[str, dict]) -> None:
+        """Add an entity per list setting (other than On/Off)."""
+        async_add_entities(
+            VizioSettingSelect(
+                coordinator,
+                client,
+                entry["name"],
+                entry["group"],
+                entry["options"],
+                enabled_default=key in DEFAULT_ENABLED_SETTINGS,
+            )
+            for key, entry in settings.items()
+        )
+
+    async_add_settings(registry.entries("select"))
+    # Settings found once the TV's menu has been read
+    registry.async_add_listener("select", async_add_settings)
 
 class VizioSourceSelect(CoordinatorEntity, SelectEntity):
-    """Vizio source selector (inputs + apps)."""
+    """Vizio source selector (inputs + apps).
+
+    Inputs come from the TV; apps from the AppCatalog shared by all TVs,
+    which also launches them by config without pyvizio's list scan.
+    """
 
-    def __init__(self, coordinator, vizio) -> None:
+    def __init__(
+        self, coordinator, vizio, source_cache: SourceListCache, app_catalog: AppCatalog
+    ) -> None:
         """Initialize select entity."""
-        super().__init__(coordinator)
+        # power_state too, to retry loading inputs once the TV is on
+        super().__init__(coordinator, context=frozenset({"current_source", "power_state"}))
         self._vizio = vizio
-        self._attr_name = "Vizio Source"
-        self._attr_unique_id = "vizio_source"
-        self._inputs = []
-        self._apps = []
+        self._source_cache = source_cache
+        self._app_catalog = app_catalog
+        self._load_task: asyncio.Task | None = None
+        self._attr_name = f"{coordinator.device_name} Source"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_source"
+        self._inputs: list[str] = []
+        # Same inputs, for lookups
+        self._input_set: set[str] = set()
+        self._apps: list[str] = []
         # Start with loading placeholder so entity isn't unavailable
         self._all_options = ["Loading..."]
 
     async def async_added_to_hass(self) -> None:
-        """Load options when added to hass."""
+        """Load options when added to hass.
+
+        A cached source list is used right away; it's re-fetched in the
+        background if missing or older than SOURCE_LIST_TTL.
+        """
         await super().async_added_to_hass()
-        await self._try_load_options()
+
+        cached = self._source_cache.get(self.coordinator.unique_id_prefix)
+        if cached:
+            self._set_inputs(cached)
+            self._apps = self._app_catalog.names
+            self._all_options = self._inputs + self._apps
+            _LOGGER.debug(f"Using cached source list ({len(self._all_options)} options)")
+        # The catalog is re-downloaded in the background when stale
+        self.async_on_remove(self._app_catalog.async_add_listener(self._async_update_apps))
+
+        if not self._source_cache.is_fresh(self.coordinator.unique_id_prefix):
+            self._async_start_load()
+
+    def _set_inputs(self, inputs: list[str]) -> None:
+        """Set the TV's inputs."""
+        self._inputs = inputs
+        self._input_set = set(inputs)
+
+    @callback
+    def _async_update_apps(self) -> None:
+        """Show the apps from a newly downloaded catalog."""
+        # Until the source list loads, the placeholder (or error) stays
+        loaded = bool(self._inputs or self._apps)
+        self._apps = self._app_catalog.names
+        if loaded:
+            self._all_options = self._inputs + self._apps
+            self.async_write_ha_state()
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         # Retry loading if inputs missing (apps loaded but inputs didn't)
         has_hdmi = any("HDMI" in inp for inp in self._inputs)
         if not has_hdmi and self.coordinator.data.get("power_state"):
-            self.hass.async_create_task(self._try_load_options())
+            self._async_start_load()
         super()._handle_coordinator_update()
 
+    @callback
+    def _async_start_load(self) -> None:
+        """Load options in the background, unless a load is already running."""
+        if self._load_task is not None and not self._load_task.done():
+            return
+        # In the background so a slow TV doesn't hold up startup
+        self._load_task = self.hass.async_create_background_task(
+            self._try_load_options(), f"{DOMAIN} source list {self.coordinator.device_name}"
+        )
+
     async def _try_load_options(self) -> None:
         """Try to load options, handling errors."""
         try:
             await self._async_update_options()
         except Exception as e:
             _LOGGER.error(f"Failed to load source options: {e}", exc_info=True)
-            self._all_options = ["Error loading sources"]
+            # Keep serving a previously loaded (e.g. cached) list
+            if not (self._inputs or self._apps):
+                self._all_options = ["Error loading sources"]
+        self.async_write_ha_state()
 
     async def _async_update_options(self) -> None:
         """Update available options."""
@@ -68,32 +154,30 @@ class VizioSourceSelect(CoordinatorEntity, SelectEntity):
             inputs = await self._vizio.get_inputs_list(log_api_exception=False)
             _LOGGER.debug(f"Raw inputs response: {inputs} (type: {type(inputs).__name__})")
             if inputs:
-                self._inputs = [inp.name for inp in inputs]
+                self._set_inputs([inp.name for inp in inputs])
                 _LOGGER.info(f"Loaded {len(self._inputs)} inputs: {self._inputs}")
             else:
                 _LOGGER.warning("No inputs returned from TV")
 
-            # Get apps
-            _LOGGER.debug("Fetching apps list...")
-            apps = await self._vizio.get_apps_list()
-            if apps:
-                # Apps are returned as strings, not objects
-                self._apps = sorted(apps)
-                _LOGGER.info(f"Loaded {len(self._apps)} apps")
-            else:
-                _LOGGER.warning("No apps returned from TV")
+            # Apps from the shared catalog (already loaded)
+            apps = self._app_catalog.names
+            self._apps = apps
+            _LOGGER.debug(f"Using {len(self._apps)} apps from the app catalog")
 
             # Combine: inputs first, then apps
             if self._inputs or self._apps:
                 self._all_options = self._inputs + self._apps
                 _LOGGER.info(f"Total options available: {len(self._all_options)}")
+                if inputs:
+                    self._source_cache.async_set(self.coordinator.unique_id_prefix, self._inputs)
             else:
                 _LOGGER.error("No inputs or apps loaded - TV may be off or unreachable")
                 self._all_options = ["TV unreachable"]
 
         except Exception as e:
             _LOGGER.error(f"Error updating source options: {e}", exc_info=True)
-            self._all_options = ["Error loading sources"]
+            if not (self._inputs or self._apps):
+                self._all_options = ["Error loading sources"]
 
     @property
     def options(self) -> list[str]:
@@ -103,40 +187,104 @@ class VizioSourceSelect(CoordinatorEntity, SelectEntity):
     @property
     def current_option(self) -> str | None:
         """Return current source."""
-        current = self.coordinator.data.get("current_source")
-        _LOGGER.debug(f"Current source from coordinator: {current}")
-        return current
+        return self.coordinator.data.get("current_source")
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        # Entity is available if we have real options (not error messages)
-        return len(self._all_options) > 0 and self._all_options[0] not in ["Loading...", "Error loading sources", "TV unreachable"]
+        # Entity is available if the TV is reachable and we have real
+        # options (not error messages)
+        return super().available and len(self._all_options) > 0 and self._all_options[0] not in ["Loading...", "Error loading sources", "TV unreachable"]
 
     async def async_select_option(self, option: str) -> None:
-        """Select new source."""
+        """Select new source.
+
+        Shows the new source right away, then re-reads just current_source
+        until the TV has switched (see coordinator.async_confirm_key).
+        """
+        if option not in self._input_set and option not in self._app_catalog:
+            _LOGGER.error(f"Unknown source: {option} (not in inputs or apps)")
+            return
+
+        self.coordinator.async_set_optimistic("current_source", option)
+        result = False
         try:
             # Check if it's an input or app
-            if option in self._inputs:
+            if option in self._input_set:
                 # It's an input
                 _LOGGER.info(f"Switching to input: {option}")
-                result = await self._vizio.set_input(option, log_api_exception=False)
+                result = await self.coordinator.client.async_call(
+                    self._vizio.set_input(option, log_api_exception=False)
+                )
                 if result:
                     _LOGGER.info(f"Successfully switched to input: {option}")
-                    await self.coordinator.async_request_refresh()
                 else:
                     _LOGGER.error(f"Failed to switch to input: {option}")
-            elif option in self._apps:
+            else:
                 # It's an app
                 _LOGGER.info(f"Launching app: {option}")
-                result = await self._vizio.launch_app(option, log_api_exception=False)
+                result = await self.coordinator.client.async_call(
+                    self._vizio.launch_app_config(
+                        **self._app_catalog.get_config(option), log_api_exception=False
+                    )
+                )
                 if result:
                     _LOGGER.info(f"Successfully launched app: {option}")
-                    await self.coordinator.async_request_refresh()
                 else:
                     _LOGGER.error(f"Failed to launch app: {option}")
-            else:
-                _LOGGER.error(f"Unknown source: {option} (not in inputs or apps)")
 
         except Exception as e:
             _LOGGER.error(f"Error selecting source {option}: {e}", exc_info=True)
+
+        if result:
+            # Inputs take a moment to switch and apps a few seconds to launch
+            await self.coordinator.async_confirm_key("current_source", option)
+        else:
+            # Reverts the optimistic source
+            await self.coordinator.async_refresh_key("current_source")
+
+
+class VizioSettingSelect(CoordinatorEntity, SelectEntity):
+    """Select for a TV setting with a list of options found in its settings menu."""
+
+    def __init__(
+        self,
+        coordinator,
+        client,
+        setting_name: str,
+        setting_type: str,
+        options: list[str],
+        enabled_default: bool = True,
+    ) -> None:
+        """Initialize select entity."""
+        self._key = f"{setting_type}_{setting_name}"
+        super().__init__(coordinator, context=frozenset({self._key}))
+        self._client = client
+        self._setting_name = setting_name
+        self._setting_type = setting_type
+        self._attr_options = options
+        self._attr_name = f"{coordinator.device_name} {setting_name.replace('_', ' ').title()}"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_{setting_type}_{setting_name}"
+        self._attr_entity_registry_enabled_default = enabled_default
+
+    @property
+    def current_option(self) -> str | None:
+        """Return current value."""
+        value = self.coordinator.data.get(self._key)
+        return str(value) if value is not None else None
+
+    async def async_select_option(self, option: str) -> None:
+        """Set the setting, showing the new value right away."""
+        _LOGGER.info(f"Setting {self._setting_type}.{self._setting_name} to {option}")
+        self.coordinator.async_set_optimistic(self._key, option)
+
+        try:
+            if not await self._client.async_set_setting(
+                self._setting_type, self._setting_name, option, self.coordinator.data
+            ):
+                _LOGGER.error(f"async_set_setting returned False for {self._setting_name} = {option}")
+        except Exception as e:
+            _LOGGER.error(f"Exception setting {self._setting_name}: {e}", exc_info=True)
+
+        # Confirms the new value, or reverts the optimistic one on failure
+        await self.coordinator.async_refresh_key(self._key)
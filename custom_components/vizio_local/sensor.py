@@ -0,0 +1,100 @@
+"""Diagnostic sensors for Vizio TV request and poll statistics."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from . import DOMAIN
+from .stats import LatencyStats
+
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up diagnostic sensor entities."""
+    if discovery_info is None:
+        return
+
+    device = hass.data[DOMAIN]["devices"][discovery_info["device_id"]]
+    coordinator = device["coordinator"]
+    client = device["client"]
+
+    cycles = coordinator.cycle_stats
+    requests = client.request_stats
+
+    async_add_entities([
+        VizioStatsSensor(
+            coordinator, "Poll Cycle Time", "poll_cycle_time", cycles,
+            lambda stats: stats.last_ms, UnitOfTime.MILLISECONDS,
+        ),
+        VizioStatsSensor(
+            coordinator, "Request Latency", "request_latency", requests,
+            lambda stats: stats.percentile(99), UnitOfTime.MILLISECONDS,
+        ),
+        VizioStatsSensor(
+            coordinator, "Request Failures", "request_failures", requests,
+            lambda stats: stats.failures,
+        ),
+        VizioStatsSensor(
+            coordinator, "Request Timeouts", "request_timeouts", requests,
+            lambda stats: stats.timeouts,
+        ),
+    ])
+
+class VizioStatsSensor(CoordinatorEntity, SensorEntity):
+    """Sensor reporting one statistic of a TV's requests or poll cycles.
+
+    Updates after every poll cycle. Attributes carry the rest of the stats
+    (count, mean, p50/p99, max).
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        coordinator,
+        name: str,
+        key: str,
+        stats: LatencyStats,
+        value: Callable[[LatencyStats], float | int | None],
+        unit: str | None = None,
+    ) -> None:
+        """Initialize sensor entity."""
+        super().__init__(coordinator)
+        self._stats = stats
+        self._value = value
+        self._attr_name = f"{coordinator.device_name} {name}"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_{key}"
+        self._attr_native_unit_of_measurement = unit
+        if unit is None:
+            # Counters since Home Assistant started
+            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+        else:
+            self._attr_state_class = SensorStateClass.MEASUREMENT
+            self._attr_suggested_display_precision = 0
+
+    @property
+    def available(self) -> bool:
+        """Stats are available even when the TV isn't answering."""
+        return True
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the statistic."""
+        return self._value(self._stats)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the summary stats."""
+        stats = self._stats.as_dict()
+        stats.pop("histogram")
+        return stats
@@ -0,0 +1,66 @@
+"""On-disk cache of each TV's input list."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, SOURCE_LIST_TTL
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.sources"
+
+# Seconds to batch writes to disk
+SAVE_DELAY = 10
+
+
+class SourceListCache:
+    """Input lists for all TVs, stored in Home Assistant's .storage.
+
+    Apps aren't stored here; they come from the AppCatalog. Keyed per TV
+    so several TVs can share the one storage file. Entries older than
+    SOURCE_LIST_TTL are still served, but reported as stale so the caller
+    can revalidate in the background.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize cache."""
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._devices: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load cached source lists from disk."""
+        data = await self._store.async_load()
+        if data:
+            self._devices = data.get("devices", {})
+        _LOGGER.debug(f"Loaded cached source lists for {list(self._devices)}")
+
+    def get(self, device_key: str) -> list[str] | None:
+        """Return a TV's cached inputs, or None if not cached."""
+        entry = self._devices.get(device_key)
+        if entry is None:
+            return None
+        return entry["inputs"]
+
+    def is_fresh(self, device_key: str) -> bool:
+        """Return True if the TV's cached list is younger than the TTL."""
+        entry = self._devices.get(device_key)
+        if entry is None:
+            return False
+        updated = dt_util.parse_datetime(entry["updated"])
+        return updated is not None and dt_util.utcnow() - updated < SOURCE_LIST_TTL
+
+    @callback
+    def async_set(self, device_key: str, inputs: list[str]) -> None:
+        """Store a TV's inputs and schedule a save to disk."""
+        # Replaces entries written with the TV's apps by earlier versions
+        self._devices[device_key] = {
+            "inputs": inputs,
+            "updated": dt_util.utcnow().isoformat(),
+        }
+        self._store.async_delay_save(lambda: {"devices": self._devices}, SAVE_DELAY)
@@ -0,0 +1,79 @@
+"""Latency and outcome tracking for TV requests and poll cycles."""
+from __future__ import annotations
+
+from typing import Any
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class LatencyStats:
+    """Counts, outcomes and a latency histogram for one kind of operation."""
+
+    def __init__(self) -> None:
+        """Initialize stats."""
+        self.count = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_ms: float | None = None
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def record(self, elapsed_ms: float, failed: bool = False, timed_out: bool = False) -> None:
+        """Record one operation."""
+        self.count += 1
+        if timed_out:
+            self.timeouts += 1
+        elif failed:
+            self.failures += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.last_ms = elapsed_ms
+
+        for index, bound in enumerate(LATENCY_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                self.buckets[index] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+    @property
+    def mean_ms(self) -> float | None:
+        """Return mean latency."""
+        return self.total_ms / self.count if self.count else None
+
+    def percentile(self, pct: float) -> float | None:
+        """Return an upper bound for the pct percentile latency from the histogram."""
+        if not self.count:
+            return None
+        target = pct / 100 * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets[:-1]):
+            seen += bucket_count
+            if seen >= target:
+                return min(LATENCY_BUCKETS_MS[index], self.max_ms)
+        return self.max_ms
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return stats for diagnostics."""
+        histogram = {
+            f"<={bound}ms": count
+            for bound, count in zip(LATENCY_BUCKETS_MS, self.buckets)
+        }
+        histogram[f">{LATENCY_BUCKETS_MS[-1]}ms"] = self.buckets[-1]
+        return {
+            "count": self.count,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "last_ms": _round(self.last_ms),
+            "mean_ms": _round(self.mean_ms),
+            "p50_ms": _round(self.percentile(50)),
+            "p99_ms": _round(self.percentile(99)),
+            "max_ms": _round(self.max_ms),
+            "histogram": histogram,
+        }
+
+
+def _round(value: float | None) -> float | None:
+    return round(value, 1) if value is not None else None
@@ -1,16 +1,17 @@
-"""Switch entity for Vizio TV mute."""
+"""Switch entities for Vizio TV (power, mute and On/Off settings)."""
 from __future__ import annotations
 
 import logging
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import DOMAIN
+from .registry import DEFAULT_ENABLED_SETTINGS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,23 +22,47 @@ async def async_setup_platform(
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
     """Set up switch entities."""
-    coordinator = hass.data[DOMAIN]["coordinator"]
-    vizio = hass.data[DOMAIN]["vizio"]
+    if discovery_info is None:
+        return
+
+    device = hass.data[DOMAIN]["devices"][discovery_info["device_id"]]
+    coordinator = device["coordinator"]
+    client = device["client"]
+    vizio = device["vizio"]
+    registry = device["settings"]
 
     async_add_entities([
-        VizioMuteSwitch(coordinator, vizio),
+        VizioMuteSwitch(coordinator, client),
         VizioPowerSwitch(coordinator, vizio),
     ])
 
+    @callback
+    def async_add_settings(settings: dict[str, dict]) -> None:
+        """Add an entity per On/Off setting."""
+        async_add_entities(
+            VizioSettingSwitch(
+                coordinator,
+                client,
+                entry["name"],
+                entry["group"],
+                enabled_default=key in DEFAULT_ENABLED_SETTINGS,
+            )
+            for key, entry in settings.items()
+        )
+
+    async_add_settings(registry.entries("switch"))
+    # Settings found once the TV's menu has been read
+    registry.async_add_listener("switch", async_add_settings)
+
 class VizioMuteSwitch(CoordinatorEntity, SwitchEntity):
     """Vizio mute switch."""
 
-    def __init__(self, coordinator, vizio) -> None:
+    def __init__(self, coordinator, client) -> None:
         """Initialize switch entity."""
-        super().__init__(coordinator)
-        self._vizio = vizio
-        self._attr_name = "Vizio Mute"
-        self._attr_unique_id = "vizio_mute"
+        super().__init__(coordinator, context=frozenset({"audio_mute"}))
+        self._client = client
+        self._attr_name = f"{coordinator.device_name} Mute"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_mute"
 
     @property
     def is_on(self) -> bool | None:
@@ -48,28 +73,33 @@ class VizioMuteSwitch(CoordinatorEntity, SwitchEntity):
         return None
 
     async def _set_mute(self, value: str) -> bool:
-        """Set mute state (internal helper)."""
+        """Set mute state (internal helper).
+
+        Shows the new state right away, then re-reads just audio_mute.
+        """
         _LOGGER.info(f"Setting audio.mute to {value}")
+        self.coordinator.async_set_optimistic("audio_mute", value)
 
         try:
-            result = await self._vizio.set_setting(
+            result = await self._client.async_set_setting(
                 "audio",
                 "mute",
                 value,
-                log_api_exception=False,
+                self.coordinator.data,
             )
 
             if result:
                 _LOGGER.info(f"Successfully set mute to {value}")
-                await self.coordinator.async_request_refresh()
-                return True
             else:
-                _LOGGER.error(f"set_setting returned False for mute = {value}")
-                return False
+                _LOGGER.error(f"async_set_setting returned False for mute = {value}")
 
         except Exception as e:
             _LOGGER.error(f"Exception setting mute: {e}", exc_info=True)
-            return False
+            result = False
+
+        # Confirms the new state, or reverts the optimistic one on failure
+        await self.coordinator.async_refresh_key("audio_mute")
+        return bool(result)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Mute TV."""
@@ -89,10 +119,10 @@ class VizioPowerSwitch(CoordinatorEntity, SwitchEntity):
 
     def __init__(self, coordinator, vizio) -> None:
         """Initialize switch entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=frozenset({"power_state", "power_mode"}))
         self._vizio = vizio
-        self._attr_name = "Vizio Power"
-        self._attr_unique_id = "vizio_power"
+        self._attr_name = f"{coordinator.device_name} Power"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_power"
 
     @property
     def is_on(self) -> bool | None:
@@ -126,25 +156,93 @@ class VizioPowerSwitch(CoordinatorEntity, SwitchEntity):
             return
 
         _LOGGER.info("Turning on TV")
+        self.coordinator.async_set_optimistic("power_state", True)
+        result = False
         try:
-            result = await self._vizio.pow_on(log_api_exception=False)
+            result = await self.coordinator.client.async_call(
+                self._vizio.pow_on(log_api_exception=False)
+            )
             if result:
                 _LOGGER.info("Successfully turned on TV")
-                await self.coordinator.async_request_refresh()
             else:
                 _LOGGER.error("pow_on returned False")
         except Exception as e:
             _LOGGER.error(f"Exception turning on TV: {e}", exc_info=True)
+        if result:
+            await self.coordinator.async_confirm_key("power_state", True)
+        else:
+            await self.coordinator.async_refresh_key("power_state")
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off TV."""
         _LOGGER.info("Turning off TV")
+        self.coordinator.async_set_optimistic("power_state", False)
+        result = False
         try:
-            result = await self._vizio.pow_off(log_api_exception=False)
+            result = await self.coordinator.client.async_call(
+                self._vizio.pow_off(log_api_exception=False)
+            )
             if result:
                 _LOGGER.info("Successfully turned off TV")
-                await self.coordinator.async_request_refresh()
             else:
                 _LOGGER.error("pow_off returned False")
         except Exception as e:
             _LOGGER.error(f"Exception turning off TV: {e}", exc_info=True)
+        if result:
+            await self.coordinator.async_confirm_key("power_state", False)
+        else:
+            await self.coordinator.async_refresh_key("power_state")
+
+
+class VizioSettingSwitch(CoordinatorEntity, SwitchEntity):
+    """Switch for an On/Off TV setting found in its settings menu."""
+
+    def __init__(
+        self,
+        coordinator,
+        client,
+        setting_name: str,
+        setting_type: str,
+        enabled_default: bool = True,
+    ) -> None:
+        """Initialize switch entity."""
+        self._key = f"{setting_type}_{setting_name}"
+        super().__init__(coordinator, context=frozenset({self._key}))
+        self._client = client
+        self._setting_name = setting_name
+        self._setting_type = setting_type
+        self._attr_name = f"{coordinator.device_name} {setting_name.replace('_', ' ').title()}"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_{setting_type}_{setting_name}"
+        self._attr_entity_registry_enabled_default = enabled_default
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return True if the setting is On."""
+        value = self.coordinator.data.get(self._key)
+        if value is not None:
+            return value == "On"
+        return None
+
+    async def _set_value(self, value: str) -> None:
+        """Set the setting, showing the new state right away."""
+        _LOGGER.info(f"Setting {self._setting_type}.{self._setting_name} to {value}")
+        self.coordinator.async_set_optimistic(self._key, value)
+
+        try:
+            if not await self._client.async_set_setting(
+                self._setting_type, self._setting_name, value, self.coordinator.data
+            ):
+                _LOGGER.error(f"async_set_setting returned False for {self._setting_name} = {value}")
+        except Exception as e:
+            _LOGGER.error(f"Exception setting {self._setting_name}: {e}", exc_info=True)
+
+        # Confirms the new state, or reverts the optimistic one on failure
+        await self.coordinator.async_refresh_key(self._key)
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Turn the setting On."""
+        await self._set_value("On")
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Turn the setting Off."""
+        await self._set_value("Off")
@@ -0,0 +1,69 @@
+"""Latest-value-wins write scheduling for Vizio settings."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+_UNSET = object()
+
+
+class CoalescingWriter:
+    """Write scheduler for a single setting.
+
+    Only one write is in flight at a time. Values requested while a write is
+    in flight replace the pending value, so a burst of slider updates sends
+    the first value and then only the latest one. Once the burst has drained
+    on_settled is called once (e.g. to refresh the written key, which
+    confirms the value or reverts an optimistic one if the write failed).
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        write: Callable[[Any], Awaitable[bool]],
+        on_settled: Callable[[], Awaitable[None]],
+    ) -> None:
+        """Initialize writer."""
+        self._hass = hass
+        self._name = name
+        self._write = write
+        self._on_settled = on_settled
+        self._pending: Any = _UNSET
+        self._task: asyncio.Task | None = None
+
+    async def async_write(self, value: Any) -> None:
+        """Queue value to be written, replacing any value not yet sent.
+
+        Returns once the burst this value belongs to has been written.
+        """
+        if self._pending is not _UNSET:
+            _LOGGER.debug(f"Coalescing {self._name}: {self._pending} replaced by {value}")
+        self._pending = value
+
+        if self._task is None or self._task.done():
+            self._task = self._hass.async_create_task(self._async_drain())
+
+        # Shield so a cancelled caller doesn't cancel writes for other callers
+        await asyncio.shield(self._task)
+
+    async def _async_drain(self) -> None:
+        """Write pending values until none are left, then settle.
+
+        A value queued while settling joins this task, so it's written in
+        another round rather than left pending.
+        """
+        while True:
+            while self._pending is not _UNSET:
+                value, self._pending = self._pending, _UNSET
+                await self._write(value)
+
+            await self._on_settled()
+            if self._pending is _UNSET:
+                break
@@ -0,0 +1,57 @@
+"""Tests for reading the TV's settings menu into a schema."""
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.vizio_local.api import GetSettingsGroupCommand  # noqa: E402
+from custom_components.vizio_local.registry import schema_entry  # noqa: E402
+
+PICTURE_MENU = {
+    "STATUS": {"RESULT": "SUCCESS", "DETAIL": "Success"},
+    "HASHLIST": [1001, 1002, 1003, 1004],
+    "ITEMS": [
+        {
+            "CNAME": "backlight",
+            "TYPE": "T_VALUE_ABS_V1",
+            "HASHVAL": 11,
+            "VALUE": 30,
+            "MINIMUM": 0,
+            "MAXIMUM": 100,
+        },
+        {
+            "CNAME": "picture_mode",
+            "TYPE": "T_LIST_X_V1",
+            "HASHVAL": 12,
+            "VALUE": "Calibrated",
+            "ELEMENTS": ["Vivid", "Bright", "Calibrated", "Calibrated Dark", "Game"],
+        },
+        {
+            "CNAME": "auto_brightness_control",
+            "TYPE": "T_LIST_V1",
+            "HASHVAL": 13,
+            "VALUE": "Off",
+            "ELEMENTS": ["Off", "On"],
+        },
+        {"CNAME": "picture_mode_edit", "TYPE": "T_MENU_V1", "HASHVAL": 14},
+    ],
+}
+
+
+def test_x_list_settings_are_discovered() -> None:
+    """An X list item is read with its value and becomes a select."""
+    group = GetSettingsGroupCommand("tv", "picture").process_response(PICTURE_MENU)
+
+    assert set(group.items) == {"backlight", "picture_mode", "auto_brightness_control"}
+    assert group.items["picture_mode"].value == "Calibrated"
+
+    entries = {name: schema_entry("picture", item) for name, item in group.items.items()}
+    assert entries["picture_mode"] == {
+        "group": "picture",
+        "name": "picture_mode",
+        "platform": "select",
+        "options": ["Vivid", "Bright", "Calibrated", "Calibrated Dark", "Game"],
+    }
+    assert entries["auto_brightness_control"]["platform"] == "switch"
+    assert entries["backlight"]["platform"] == "number"
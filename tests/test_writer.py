@@ -0,0 +1,46 @@
+"""Tests for the coalescing setting writer."""
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.vizio_local.writer import CoalescingWriter  # noqa: E402
+
+
+def test_write_during_settle_is_sent() -> None:
+    """A value queued while the writer settles is written, then settled again."""
+
+    async def run() -> tuple[list[int], int]:
+        hass = SimpleNamespace(async_create_task=asyncio.get_running_loop().create_task)
+        written: list[int] = []
+        settles = 0
+        settling = asyncio.Event()
+        resume = asyncio.Event()
+
+        async def write(value: int) -> bool:
+            written.append(value)
+            return True
+
+        async def on_settled() -> None:
+            nonlocal settles
+            settles += 1
+            if settles == 1:
+                settling.set()
+                await resume.wait()
+
+        writer = CoalescingWriter(hass, "picture_backlight", write, on_settled)
+        first = asyncio.ensure_future(writer.async_write(10))
+        await settling.wait()
+        second = asyncio.ensure_future(writer.async_write(42))
+        await asyncio.sleep(0)
+        resume.set()
+        await asyncio.gather(first, second)
+        return written, settles
+
+    written, settles = asyncio.run(run())
+    assert written == [10, 42]
+    assert settles == 2